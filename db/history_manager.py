@@ -14,9 +14,10 @@ PLEX Dynamic Staking Manager - History Manager
 
 import json
 import sqlite3
+from contextlib import closing
 import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from decimal import Decimal
 from enum import Enum
@@ -402,6 +403,73 @@ class HistoryManager:
             user_id=user_id
         )
     
+    def _build_history_filter(self,
+                              start_date: Optional[datetime] = None,
+                              end_date: Optional[datetime] = None,
+                              operation_types: Optional[List[OperationType]] = None,
+                              component: Optional[str] = None,
+                              session_id: Optional[str] = None,
+                              user_id: Optional[str] = None,
+                              success: Optional[bool] = None) -> Tuple[str, List[Any]]:
+        """Построение WHERE-условия и параметров для выборки истории"""
+        conditions = []
+        params = []
+        
+        # Фильтр по дате
+        if start_date:
+            conditions.append("timestamp >= ?")
+            params.append(start_date.isoformat())
+        
+        if end_date:
+            conditions.append("timestamp <= ?")
+            params.append(end_date.isoformat())
+        
+        # Фильтр по типам операций
+        if operation_types:
+            placeholders = ",".join("?" for _ in operation_types)
+            conditions.append(f"operation_type IN ({placeholders})")
+            params.extend([op.value for op in operation_types])
+        
+        # Фильтр по компоненту
+        if component:
+            conditions.append("component = ?")
+            params.append(component)
+        
+        # Фильтр по сессии
+        if session_id:
+            conditions.append("session_id = ?")
+            params.append(session_id)
+        
+        # Фильтр по пользователю
+        if user_id:
+            conditions.append("user_id = ?")
+            params.append(user_id)
+        
+        # Фильтр по успешности
+        if success is not None:
+            conditions.append("success = ?")
+            params.append(success)
+        
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        return where_clause, params
+    
+    @staticmethod
+    def _row_to_record(row) -> HistoryRecord:
+        """Преобразование строки operation_history в HistoryRecord"""
+        return HistoryRecord(
+            id=row[0],
+            timestamp=datetime.fromisoformat(row[1]),
+            operation_type=OperationType(row[2]),
+            user_id=row[3],
+            session_id=row[4],
+            component=row[5],
+            details=json.loads(row[6]) if row[6] else {},
+            success=bool(row[7]),
+            execution_time_ms=row[8],
+            error_message=row[9],
+            metadata=json.loads(row[10]) if row[10] else None
+        )
+    
     def get_history(self,
                    start_date: Optional[datetime] = None,
                    end_date: Optional[datetime] = None,
@@ -413,45 +481,9 @@ class HistoryManager:
                    limit: int = 1000) -> List[HistoryRecord]:
         """Получение истории операций с фильтрами"""
         try:
-            conditions = []
-            params = []
-            
-            # Фильтр по дате
-            if start_date:
-                conditions.append("timestamp >= ?")
-                params.append(start_date.isoformat())
-            
-            if end_date:
-                conditions.append("timestamp <= ?")
-                params.append(end_date.isoformat())
-            
-            # Фильтр по типам операций
-            if operation_types:
-                placeholders = ",".join("?" for _ in operation_types)
-                conditions.append(f"operation_type IN ({placeholders})")
-                params.extend([op.value for op in operation_types])
-            
-            # Фильтр по компоненту
-            if component:
-                conditions.append("component = ?")
-                params.append(component)
-            
-            # Фильтр по сессии
-            if session_id:
-                conditions.append("session_id = ?")
-                params.append(session_id)
-            
-            # Фильтр по пользователю
-            if user_id:
-                conditions.append("user_id = ?")
-                params.append(user_id)
-            
-            # Фильтр по успешности
-            if success is not None:
-                conditions.append("success = ?")
-                params.append(success)
-            
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
+            where_clause, params = self._build_history_filter(
+                start_date, end_date, operation_types, component, session_id, user_id, success
+            )
             
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.execute(f"""
@@ -464,29 +496,60 @@ class HistoryManager:
                     LIMIT ?
                 """, params + [limit])
                 
-                records = []
-                for row in cursor.fetchall():
-                    record = HistoryRecord(
-                        id=row[0],
-                        timestamp=datetime.fromisoformat(row[1]),
-                        operation_type=OperationType(row[2]),
-                        user_id=row[3],
-                        session_id=row[4],
-                        component=row[5],
-                        details=json.loads(row[6]) if row[6] else {},
-                        success=bool(row[7]),
-                        execution_time_ms=row[8],
-                        error_message=row[9],
-                        metadata=json.loads(row[10]) if row[10] else None
-                    )
-                    records.append(record)
-                
-                return records
+                return [self._row_to_record(row) for row in cursor.fetchall()]
                 
         except Exception as e:
             logger.error(f"Ошибка получения истории: {e}")
             return []
     
+    def iter_history(self,
+                     batch_size: int = 500,
+                     start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None,
+                     operation_types: Optional[List[OperationType]] = None,
+                     component: Optional[str] = None,
+                     session_id: Optional[str] = None,
+                     user_id: Optional[str] = None,
+                     success: Optional[bool] = None) -> Iterator[List[HistoryRecord]]:
+        """
+        Потоковое чтение истории пачками по batch_size записей.
+        
+        Порядок и фильтры как у get_history, но без ограничения количества:
+        строки читаются курсором через fetchmany, поэтому первая пачка
+        доступна до того, как прочитана вся таблица.
+        
+        Соединение и курсор закрываются и при досрочной остановке
+        потребителя (close генератора); ошибка чтения логируется
+        и завершает поток пачек.
+        """
+        where_clause, params = self._build_history_filter(
+            start_date, end_date, operation_types, component, session_id, user_id, success
+        )
+        
+        try:
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                cursor = conn.execute(f"""
+                    SELECT id, timestamp, operation_type, user_id, session_id,
+                           component, details, success, execution_time_ms,
+                           error_message, metadata
+                    FROM operation_history
+                    WHERE {where_clause}
+                    ORDER BY timestamp DESC
+                """, params)
+                
+                try:
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        
+                        yield [self._row_to_record(row) for row in rows]
+                finally:
+                    cursor.close()
+                    
+        except sqlite3.Error as e:
+            logger.error(f"Ошибка получения истории: {e}")
+    
     def get_statistics(self, 
                       start_date: Optional[datetime] = None,
                       end_date: Optional[datetime] = None) -> Dict[str, Any]:
@@ -0,0 +1,43 @@
+"""
+PLEX Dynamic Staking Manager - Worker Dispatch
+Передача результатов фоновых потоков в UI поток вкладок.
+
+Автор: PLEX Dynamic Staking Team
+Версия: 1.0.0
+"""
+
+from tkinter import TclError
+from typing import Callable
+
+
+class WorkerDispatchMixin:
+    """
+    Примесь для виджетов, получающих результаты из рабочих потоков.
+
+    Рабочий поток вызывает _post вместо self.after(0, ...). Виджет
+    в destroy выставляет _destroyed = True, после чего результаты
+    потоков отбрасываются.
+    """
+
+    # Виджет уничтожен: результаты рабочих потоков отбрасываются
+    _destroyed = False
+
+    def _post(self, callback: Callable, *args) -> None:
+        """
+        Передача вызова из рабочего потока в UI поток.
+
+        После destroy вызов отбрасывается: и при постановке в очередь,
+        и если виджет уничтожен, пока вызов ждал в очереди.
+        """
+        if self._destroyed:
+            return
+        try:
+            self.after(0, self._run_posted, callback, args)
+        except (RuntimeError, TclError):
+            # Окно уничтожено между проверкой и вызовом after
+            pass
+
+    def _run_posted(self, callback: Callable, args: tuple) -> None:
+        """Выполнение вызова из рабочего потока, если виджет еще существует."""
+        if not self._destroyed:
+            callback(*args)
@@ -6,24 +6,205 @@ PLEX Dynamic Staking Manager - Enhanced History Tab
 Версия: 1.1.0
 """
 
-import asyncio
-import threading
+import csv
+import heapq
+import io
+import json
+import unicodedata
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import Dict, List, Optional, Any, Tuple
-import tkinter as tk
+from functools import lru_cache
+from itertools import accumulate, islice
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 from tkinter import messagebox, filedialog, ttk
 import customtkinter as ctk
 
 from ui.themes.dark_theme import get_theme
-from ui.components.progress_bar import ProgressBar, ProgressState
+from ui.components.progress_bar import ProgressBar
+from ui.components.worker_dispatch import WorkerDispatchMixin
+from utils.export_writers import dumps_json, open_export, write_csv, write_excel
 from utils.logger import get_logger
 from utils.widget_factory import SafeWidgetFactory
 
 logger = get_logger(__name__)
 
+# Категории операций HistoryManager для фильтра типов
+_OPERATION_CATEGORIES = {
+    'analysis_start': 'analysis',
+    'analysis_complete': 'analysis',
+    'participant_categorized': 'analysis',
+    'reward_calculated': 'reward',
+    'payment_registered': 'payment',
+    'payment_confirmed': 'payment',
+    'payment_failed': 'payment',
+    'blockchain_query': 'blockchain',
+    'cache_hit': 'blockchain',
+    'cache_miss': 'blockchain',
+}
 
-class EnhancedHistoryTab(ctk.CTkFrame):
+_TYPE_ICONS = {
+    'analysis': '📊',
+    'reward': '🎁',
+    'payment': '💰',
+    'blockchain': '🔗',
+    'system': '⚙️',
+}
+
+_STATUS_ICONS = {
+    'success': '✅',
+    'failed': '❌',
+}
+
+# Статус операции -> вариант цвета темы
+_STATUS_COLORS = {
+    'success': 'success',
+    'failed': 'error',
+}
+
+# Количество строк, добавляемых в таблицу за один проход event loop
+_TABLE_BATCH_SIZE = 500
+
+# Максимальная длина описания в таблице
+_DESCRIPTION_MAX_LEN = 80
+
+# Символы, которые продолжают предыдущий символ (ZWJ и селекторы вариантов)
+_GRAPHEME_JOINERS = frozenset('\u200d\ufe0e\ufe0f')
+
+# Колонки файлов экспорта истории
+_EXPORT_FIELDS = (
+    'id', 'timestamp', 'operation_type', 'category', 'component',
+    'description', 'status', 'duration_ms', 'details'
+)
+
+# Расширение файла -> метод записи экспорта
+_EXPORT_WRITERS = {
+    '.csv': '_export_history_to_csv',
+    '.xlsx': '_export_history_to_excel',
+    '.json': '_export_history_to_json',
+}
+
+# Колонка details для операций без деталей (без вызова json.dumps)
+_EMPTY_DETAILS_JSON = '{}'
+
+# Размер истории, до которого CSV собирается в памяти и пишется одним блоком
+_CSV_IN_MEMORY_LIMIT = 100_000
+
+# Количество операций, сериализуемых в JSON за один вызов
+_JSON_CHUNK_SIZE = 10_000
+
+# Период уведомлений о прогрессе экспорта (строк)
+_EXPORT_PROGRESS_EVERY = 1000
+
+# Задержка применения фильтров после последнего изменения (мс)
+_FILTER_DEBOUNCE_MS = 150
+
+# Длительность периодов фильтра
+_PERIOD_DELTAS = {
+    '1h': timedelta(hours=1),
+    '6h': timedelta(hours=6),
+    '24h': timedelta(hours=24),
+    '7d': timedelta(days=7),
+    '30d': timedelta(days=30),
+    '90d': timedelta(days=90),
+}
+
+
+class HistoryEntry(NamedTuple):
+    """Операция истории в виде, готовом для фильтрации и отображения."""
+    id: str
+    timestamp: datetime
+    timestamp_iso: str
+    operation_type: str
+    category: str
+    component: str
+    description: str
+    status: str
+    duration: Optional[float]
+    details: Dict[str, Any]
+    row_values: Tuple[str, ...]
+
+
+def _format_duration(duration: Optional[float]) -> str:
+    """Форматирование длительности операции для таблицы."""
+    if duration is None:
+        return "—"
+    if duration < 1000:
+        return f"{duration:.0f} мс"
+    return f"{duration / 1000:.1f} с"
+
+
+def _shorten_description(text: str) -> str:
+    """
+    Обрезка описания для колонки таблицы.
+    
+    Граница разреза сдвигается назад, если следующий символ продолжает
+    предыдущий (комбинируемые знаки, ZWJ, селекторы вариантов), чтобы
+    не разрывать составные эмодзи и буквы с диакритикой.
+    """
+    if len(text) <= _DESCRIPTION_MAX_LEN:
+        return text
+    
+    cut = _DESCRIPTION_MAX_LEN - 3
+    while cut > 0 and (
+        text[cut] in _GRAPHEME_JOINERS or unicodedata.combining(text[cut])
+    ):
+        cut -= 1
+    if cut > 0 and text[cut - 1] == '\u200d':
+        cut -= 1
+    
+    return text[:cut] + "..."
+
+
+def _iter_export_rows(history: Iterable[HistoryEntry]) -> Iterator[Tuple[Any, ...]]:
+    """Строки экспорта в порядке _EXPORT_FIELDS, без промежуточного списка."""
+    # Локальная ссылка и распаковка кортежа вместо обращений к атрибутам в цикле
+    dumps = json.dumps
+    
+    for (entry_id, _timestamp, timestamp_iso, operation_type, category, component,
+         description, status, duration, details, _row_values) in history:
+        yield (
+            entry_id,
+            timestamp_iso,
+            operation_type,
+            category,
+            component,
+            description,
+            status,
+            '' if duration is None else duration,
+            dumps(details, ensure_ascii=False, default=str) if details else _EMPTY_DETAILS_JSON
+        )
+
+
+def _iter_with_progress(history: List[HistoryEntry],
+                        progress: Optional[Callable[[int], None]]) -> Iterator[HistoryEntry]:
+    """
+    Проход по истории с вызовом progress каждые _EXPORT_PROGRESS_EVERY строк.
+    
+    Редкие уведомления не засоряют очередь событий Tk при экспорте из потока.
+    """
+    if progress is None:
+        yield from history
+        return
+    
+    for index, item in enumerate(history, 1):
+        if index % _EXPORT_PROGRESS_EVERY == 0:
+            progress(index)
+        yield item
+
+
+@lru_cache(maxsize=64)
+def _period_start(period: str, now_minute: datetime) -> Optional[datetime]:
+    """Начало периода фильтра (None для 'all'), с точностью до минуты."""
+    period_delta = _PERIOD_DELTAS.get(period)
+    return now_minute - period_delta if period_delta else None
+
+
+class EnhancedHistoryTab(WorkerDispatchMixin, ctk.CTkFrame):
     """
     Улучшенная вкладка истории операций.
     
@@ -54,7 +235,31 @@ class EnhancedHistoryTab(ctk.CTkFrame):
         # Данные истории
         self.current_history = []
         self.filtered_history = []
+        self._history_by_category = {}
+        self._history_ts_keys = {}
+        self._history_failed_counts = {}
+        self._filter_bounds = {}
+        self._history_by_id = {}
+        self._table_fill_job = None
+        self._status_color_cache = {}
+        self._label_texts = {}
+        self._table_visible = False
+        self._filter_job = None
+        self._last_period = "7d"
+        self._last_filter_key = None
+        self._status_clear_job = None
         self.loading_history = False
+        # В таблице только первая пачка незавершенной загрузки
+        self._showing_partial_history = False
+        
+        # Один рабочий поток на все загрузки истории вкладки
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='history-load')
+        
+        # Отдельный поток для экспорта, чтобы он не ждал загрузку
+        self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='history-export')
+        self.exporting = False
+        # (список истории, его строки экспорта); меняется только в UI потоке
+        self._export_rows = (None, None)
         
         # Создание интерфейса
         self._create_widgets()
@@ -305,11 +510,11 @@ class EnhancedHistoryTab(ctk.CTkFrame):
         # Чекбоксы типов операций
         self.operation_types = {}
         types = [
-            ("stake", "Стейкинг"),
-            ("unstake", "Анстейкинг"),
+            ("analysis", "Анализ"),
             ("reward", "Награды"),
-            ("transfer", "Переводы"),
-            ("swap", "Обмены")
+            ("payment", "Выплаты"),
+            ("blockchain", "Блокчейн"),
+            ("system", "Система")
         ]
         
         types_checkboxes = ctk.CTkFrame(types_frame)
@@ -324,7 +529,7 @@ class EnhancedHistoryTab(ctk.CTkFrame):
                 types_checkboxes,
                 text=type_name,
                 variable=var,
-                command=self._apply_filters,
+                command=self._schedule_filters,
                 text_color=self.theme.colors['text_secondary']
             )
             checkbox.pack(side='left', padx=5)
@@ -393,6 +598,15 @@ class EnhancedHistoryTab(ctk.CTkFrame):
         )
         self.count_label.pack(side='left', padx=(20, 0))
         
+        # Строка статуса последней операции (вместо модальных окон)
+        self.status_line = ctk.CTkLabel(
+            header,
+            text="",
+            font=("Arial", 12),
+            text_color=self.theme.colors['text_secondary']
+        )
+        self.status_line.pack(side='left', padx=(20, 0))
+        
         # Кнопки управления отображением
         display_controls = ctk.CTkFrame(header)
         display_controls.configure(fg_color="transparent")
@@ -441,18 +655,60 @@ class EnhancedHistoryTab(ctk.CTkFrame):
         )
         self.history_placeholder.pack(expand=True, pady=50)
         
+        # Таблица операций
+        self.history_table_frame = ctk.CTkFrame(self.history_list_frame)
+        self.history_table_frame.configure(fg_color="transparent")
+        
+        self.history_tree = ttk.Treeview(
+            self.history_table_frame,
+            columns=("date", "type", "desc", "status", "duration"),
+            show="headings",
+            height=15
+        )
+        
+        self.history_tree.heading("date", text="Дата")
+        self.history_tree.heading("type", text="Тип")
+        self.history_tree.heading("desc", text="Описание")
+        self.history_tree.heading("status", text="Статус")
+        self.history_tree.heading("duration", text="Длительность")
+        
+        self.history_tree.column("date", width=140, stretch=False)
+        self.history_tree.column("type", width=180, stretch=False)
+        self.history_tree.column("desc", width=400)
+        self.history_tree.column("status", width=70, stretch=False, anchor='center')
+        self.history_tree.column("duration", width=110, stretch=False, anchor='e')
+        
+        self.history_tree.tag_configure('failed', foreground=self._get_status_color('failed'))
+        
+        self.history_tree_scrollbar = ttk.Scrollbar(
+            self.history_table_frame,
+            orient="vertical",
+            command=self.history_tree.yview
+        )
+        self.history_tree.configure(yscrollcommand=self.history_tree_scrollbar.set)
+        
+        self.history_tree.pack(side='left', fill='both', expand=True)
+        self.history_tree_scrollbar.pack(side='right', fill='y')
+        
+        self.history_tree.bind('<<TreeviewSelect>>', self._on_history_select)
+        
+        # Панель деталей создается при первом выборе строки
+        self.details_frame = None
+        
         return panel
     
     def _create_history_stats_cards(self):
         """Создание карточек статистики истории."""
         stats_data = [
-            ("📜", "Операций", "0", "info"),
-            ("💰", "Общий объем", "0.0 PLEX", "success"),
-            ("🎁", "Наград", "0.0 PLEX", "plex_primary"),
-            ("⏱️", "Последняя", "Никогда", "warning")
+            ("total", "📜", "Операций", "0", "info"),
+            ("success", "✅", "Успешных", "0", "success"),
+            ("failed", "❌", "Ошибок", "0", "error"),
+            ("recent", "⏱️", "За 24 часа", "0", "warning")
         ]
         
-        for icon, title, value, color in stats_data:
+        self.stats_labels = {}
+        
+        for key, icon, title, value, color in stats_data:
             card = ctk.CTkFrame(self.stats_frame)
             card.configure(fg_color=self.theme.colors['bg_primary'])
             card.pack(side='left', fill='x', expand=True, padx=5, pady=10)
@@ -470,12 +726,14 @@ class EnhancedHistoryTab(ctk.CTkFrame):
                 text_color=self.theme.colors['text_secondary']
             ).pack()
             
-            ctk.CTkLabel(
+            value_label = ctk.CTkLabel(
                 card,
                 text=value,
                 font=("Arial", 14, "bold"),
                 text_color=self.theme.colors[color] if color in self.theme.colors else self.theme.colors['text_primary']
-            ).pack(pady=(0, 10))
+            )
+            value_label.pack(pady=(0, 10))
+            self.stats_labels[key] = value_label
     
     def _setup_layout(self):
         """Настройка расположения виджетов."""
@@ -500,57 +758,358 @@ class EnhancedHistoryTab(ctk.CTkFrame):
     def _load_history(self):
         """Загрузка истории."""
         logger.info("📥 Загрузка истории...")
+        self._start_history_fetch("Загрузка истории...")
+    
+    def _start_history_fetch(self, message: str):
+        """
+        Чтение истории из HistoryManager в фоновом потоке.
+        
+        Прогресс отражает реальный запрос к базе, а не таймер.
+        """
+        if self.loading_history:
+            logger.debug("⏳ История уже загружается")
+            return
         
+        if not self.history_manager:
+            # Без источника данных пустая таблица не должна выглядеть как результат
+            logger.warning("⚠️ HistoryManager не подключен")
+            self.progress_bar.error("HistoryManager не подключен")
+            self._show_status("⚠️ История недоступна: HistoryManager не подключен", 'failed')
+            return
+        
+        self.loading_history = True
         self.load_history_btn.configure(state="disabled")
-        self._simulate_loading()
-    
-    def _simulate_loading(self):
-        """Симуляция загрузки истории."""
+        self.progress_bar.set_progress(0.0, message)
+        
         def run_loading():
             try:
-                self.loading_history = True
+                history = []
+                # closing: при досрочном выходе курсор и соединение с БД
+                # закрываются сразу, а не сборщиком мусора
+                with closing(self._iter_history()) as batches:
+                    for items in batches:
+                        if not self.loading_history:
+                            # Вкладка закрыта во время загрузки
+                            return
+                        
+                        history.extend(items)
+                        
+                        if len(history) == len(items):
+                            # Первая пачка отображается сразу, не дожидаясь остальных
+                            self._post(lambda first=items: self._show_first_batch(first))
+                        
+                        # Общее число записей заранее неизвестно: обновляется только счетчик
+                        self._post(lambda n=len(history): self.progress_bar.set_progress(
+                            self.progress_bar.current_value, f"Загружено операций: {n:,}"
+                        ))
                 
-                for i in range(101):
-                    if not self.loading_history:
-                        break
-                    
-                    progress = i / 100
-                    message = f"Загрузка истории... {i}%"
-                    
-                    self.after(0, lambda p=progress, m=message: self.progress_bar.set_progress(p, m))
-                    threading.Event().wait(0.02)
-                
-                if self.loading_history:
-                    self.after(0, self._loading_completed)
-                    
+                self._post(lambda: self._loading_completed(history))
             except Exception as e:
                 logger.error(f"❌ Ошибка загрузки: {e}")
-                self.after(0, self._reset_loading)
+                self._post(self._loading_failed, str(e))
         
-        thread = threading.Thread(target=run_loading, daemon=True)
-        thread.start()
+        self._executor.submit(run_loading)
     
-    def _loading_completed(self):
-        """Завершение загрузки истории."""
-        logger.info("✅ История загружена")
+    def _show_first_batch(self, items: List[HistoryEntry]):
+        """Отображение первой пачки истории до завершения загрузки."""
+        if not self.loading_history:
+            return
         
+        self._showing_partial_history = True
+        self._set_history(items)
+        self._apply_filters()
+    
+    def _loading_completed(self, history: List[HistoryEntry]):
+        """Завершение загрузки истории."""
         self.loading_history = False
+        self._showing_partial_history = False
         self.load_history_btn.configure(state="normal")
         
+        self._set_history(history)
+        self._apply_filters()
+        
+        logger.info(f"✅ История загружена: {len(self.current_history)} операций")
         self.progress_bar.set_progress(1.0, "История загружена!")
+        self._show_status(f"✓ Обновлено в {datetime.now():%H:%M:%S}", 'success')
+    
+    def _loading_failed(self, error: str):
+        """Ошибка загрузки истории (в потоке UI)."""
+        partial = self._showing_partial_history
+        self._showing_partial_history = False
+        self._reset_loading()
+        
+        if partial:
+            # Первая пачка уже в таблице: не выдаем ее за полный результат
+            self._set_history([])
+            self._apply_filters()
+        
+        self.progress_bar.error(error)
+        self._show_status(f"❌ Ошибка загрузки: {error}", 'failed', timeout_ms=10000)
+    
+    def _show_status(self, text: str, status: str = 'info', timeout_ms: int = 3000):
+        """Неблокирующее сообщение в строке статуса, скрывается через timeout_ms."""
+        if self._status_clear_job:
+            self.after_cancel(self._status_clear_job)
+        
+        self.status_line.configure(text=text, text_color=self._get_status_color(status))
+        self._status_clear_job = self.after(timeout_ms, self._clear_status)
+    
+    def _clear_status(self):
+        """Очистка строки статуса."""
+        self._status_clear_job = None
+        self.status_line.configure(text="")
+    
+    def _iter_history(self) -> Iterator[List[HistoryEntry]]:
+        """Потоковое получение операций из HistoryManager пачками."""
+        if not self.history_manager:
+            logger.warning("⚠️ HistoryManager не подключен")
+            return
+        
+        for records in self.history_manager.iter_history(batch_size=_TABLE_BATCH_SIZE):
+            yield [self._record_to_item(record) for record in records]
+    
+    def _set_history(self, history: List[HistoryEntry]):
+        """
+        Установка истории и построение индексов для фильтрации.
+        
+        Операции группируются по категории в порядке возрастания времени:
+        фильтр периода сводится к bisect по меткам времени.
+        """
+        self.current_history = history
+        self._last_filter_key = None
+        self._export_rows = (None, None)
+        
+        # HistoryManager отдает записи по убыванию времени (ORDER BY timestamp DESC),
+        # поэтому обратный проход уже упорядочен и повторная сортировка не нужна
+        by_category = defaultdict(list)
+        for item in reversed(history):
+            by_category[item.category].append(item)
         
-        # Обновление счетчика
-        self.count_label.configure(text="Записей: 1,234")
+        self._history_by_category = dict(by_category)
+        self._history_ts_keys = {
+            category: [item.timestamp for item in items]
+            for category, items in self._history_by_category.items()
+        }
+        # Накопленное число ошибок: ошибки в срезе [start:] считаются вычитанием
+        self._history_failed_counts = {
+            category: list(accumulate((item.status != 'success' for item in items), initial=0))
+            for category, items in self._history_by_category.items()
+        }
+        self._filter_bounds = {}
+    
+    def _record_to_item(self, record) -> HistoryEntry:
+        """Преобразование HistoryRecord в HistoryEntry."""
+        operation_type = record.operation_type.value
+        
+        if record.error_message:
+            description = record.error_message
+        else:
+            description = ", ".join(
+                f"{key}: {value}" for key, value in record.details.items()
+                if not isinstance(value, (dict, list))
+            )
+        
+        category = _OPERATION_CATEGORIES.get(operation_type, 'system')
+        status = 'success' if record.success else 'failed'
+        
+        # Значения колонок таблицы считаются один раз при загрузке,
+        # а не при каждом применении фильтров
+        row_values = (
+            record.timestamp.strftime('%Y-%m-%d %H:%M'),
+            f"{_TYPE_ICONS.get(category, '❓')} {operation_type}",
+            _shorten_description(description),
+            _STATUS_ICONS.get(status, '❓'),
+            _format_duration(record.execution_time_ms)
+        )
         
-        # Обновление заглушки
-        self.history_placeholder.configure(
-            text="✅ Загружено 1,234 операций\\n📊 Период: последние 7 дней"
+        return HistoryEntry(
+            id=record.id,
+            timestamp=record.timestamp,
+            timestamp_iso=record.timestamp.isoformat(),
+            operation_type=operation_type,
+            category=category,
+            component=record.component,
+            description=description,
+            status=status,
+            duration=record.execution_time_ms,
+            details=record.details,
+            row_values=row_values
         )
     
+    def _update_history_table(self):
+        """Обновление таблицы операций."""
+        if self._table_fill_job:
+            self.after_cancel(self._table_fill_job)
+            self._table_fill_job = None
+        
+        if self._history_by_id:
+            self.history_tree.delete(*self.history_tree.get_children())
+            self._history_by_id = {}
+        
+        self._set_label_text(self.count_label, f"Записей: {len(self.filtered_history):,}")
+        
+        if not self.filtered_history:
+            self._set_label_text(
+                self.history_placeholder,
+                "🔍 Нет операций, подходящих под фильтры" if self.current_history
+                else "📥 Загрузите историю для отображения операций"
+            )
+            self._set_table_visible(False)
+            return
+        
+        self._set_table_visible(True)
+        self._insert_history_rows(0)
+    
+    def _set_table_visible(self, visible: bool):
+        """Переключение таблицы и заглушки (только при смене состояния)."""
+        if visible == self._table_visible:
+            return
+        
+        self._table_visible = visible
+        
+        if visible:
+            self.history_placeholder.pack_forget()
+            self.history_table_frame.pack(fill='both', expand=True, padx=5, pady=5)
+        else:
+            self.history_table_frame.pack_forget()
+            if self.details_frame is not None:
+                self.details_frame.pack_forget()
+            self.history_placeholder.pack(expand=True, pady=50)
+    
+    def _set_label_text(self, label, text: str):
+        """
+        Обновление текста лейбла без лишних configure.
+        
+        Каждый configure у CTkLabel вызывает перерисовку и пересчет
+        геометрии, поэтому одинаковый текст повторно не выставляется.
+        """
+        if self._label_texts.get(label) == text:
+            return
+        
+        self._label_texts[label] = text
+        label.configure(text=text)
+    
+    def _insert_history_rows(self, start: int):
+        """
+        Порционное заполнение таблицы.
+        
+        Строки добавляются пачками по _TABLE_BATCH_SIZE, между пачками
+        управление возвращается event loop, поэтому большая история
+        не блокирует интерфейс.
+        """
+        end = start + _TABLE_BATCH_SIZE
+        
+        for item in self.filtered_history[start:end]:
+            self._history_by_id[item.id] = item
+            self.history_tree.insert(
+                "", "end",
+                iid=item.id,
+                values=item.row_values,
+                tags=(item.status,)
+            )
+        
+        if end < len(self.filtered_history):
+            self._table_fill_job = self.after(1, self._insert_history_rows, end)
+        else:
+            self._table_fill_job = None
+    
+    def _get_status_color(self, status: str) -> str:
+        """Цвет статуса операции (кэшируется на экземпляре)."""
+        color = self._status_color_cache.get(status)
+        if color is None:
+            color = self.theme.get_status_color(_STATUS_COLORS.get(status, status))
+            self._status_color_cache[status] = color
+        return color
+    
+    def _update_statistics(self):
+        """
+        Обновление карточек статистики по индексам истории.
+        
+        Для каждой категории отфильтрованная часть - хвост [start:] ее
+        упорядоченного списка, поэтому счетчики считаются через bisect
+        и накопленные суммы без прохода по операциям.
+        """
+        threshold = datetime.now() - timedelta(hours=24)
+        total = failed = recent = 0
+        
+        for category, start in self._filter_bounds.items():
+            ts_keys = self._history_ts_keys[category]
+            failed_counts = self._history_failed_counts[category]
+            
+            total += len(ts_keys) - start
+            failed += failed_counts[-1] - failed_counts[start]
+            recent += len(ts_keys) - max(start, bisect_left(ts_keys, threshold))
+        
+        self._set_label_text(self.stats_labels['total'], f"{total:,}")
+        self._set_label_text(self.stats_labels['success'], f"{total - failed:,}")
+        self._set_label_text(self.stats_labels['failed'], f"{failed:,}")
+        self._set_label_text(self.stats_labels['recent'], f"{recent:,}")
+    
+    def _on_history_select(self, event=None):
+        """Обработка выбора строки в таблице."""
+        selection = self.history_tree.selection()
+        if not selection:
+            return
+        
+        item = self._history_by_id.get(selection[0])
+        if item:
+            self._show_operation_details(item)
+    
+    def _ensure_details_panel(self):
+        """Создание панели деталей операции при первом обращении."""
+        if self.details_frame is not None:
+            return
+        
+        self.details_frame = ctk.CTkFrame(self.results_panel)
+        self.details_frame.configure(fg_color=self.theme.colors['bg_tertiary'])
+        
+        self.details_title = ctk.CTkLabel(
+            self.details_frame,
+            text="🔎 Детали операции",
+            font=("Arial", 14, "bold"),
+            text_color=self.theme.colors['text_primary']
+        )
+        self.details_title.pack(anchor='w', padx=10, pady=(10, 5))
+        
+        # Цвета и моноширинный шрифт - из стиля текстовых областей темы
+        self.details_text = ctk.CTkTextbox(
+            self.details_frame,
+            height=150,
+            **self.theme.get_textbox_style(),
+            wrap='none',
+            state="disabled"
+        )
+        self.details_text.pack(fill='x', padx=10, pady=(0, 10))
+    
+    def _show_operation_details(self, item: HistoryEntry):
+        """Отображение деталей операции."""
+        lines = [
+            f"ID: {item.id}",
+            f"Дата: {item.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Тип: {item.operation_type}",
+            f"Компонент: {item.component}",
+            f"Статус: {item.status}",
+        ]
+        
+        if item.duration is not None:
+            lines.append(f"Длительность: {_format_duration(item.duration)}")
+        
+        for key, value in item.details.items():
+            lines.append(f"{key}: {value}")
+        
+        self._ensure_details_panel()
+        
+        # Одна вставка готового текста; поле доступно только для чтения
+        self.details_text.configure(state="normal")
+        self.details_text.delete('1.0', 'end')
+        self.details_text.insert('1.0', "\n".join(lines))
+        self.details_text.configure(state="disabled")
+        self.details_frame.pack(fill='x', padx=15, pady=(0, 15))
+    
     def _refresh_history(self):
         """Обновление истории."""
         logger.info("🔄 Обновление истории...")
-        messagebox.showinfo("Обновлено", "История успешно обновлена!")
+        self._start_history_fetch("Обновление истории...")
     
     def _analyze_history(self):
         """Анализ истории."""
@@ -559,23 +1118,120 @@ class EnhancedHistoryTab(ctk.CTkFrame):
     
     def _clear_history(self):
         """Очистка истории."""
+        if not self.current_history:
+            self._show_status("История уже пуста", 'info')
+            return
+        
         result = messagebox.askyesno("Подтверждение", "Вы уверены, что хотите очистить историю?")
         if result:
             logger.info("🗑️ История очищена")
-            self.count_label.configure(text="Записей: 0")
-            self.history_placeholder.configure(
-                text="📥 Загрузите историю для отображения операций"
-            )
+            self._set_history([])
+            self.filtered_history = []
+            self._update_history_table()
+            self._update_statistics()
     
     def _export_csv(self):
         """Экспорт в CSV."""
         logger.info("📄 Экспорт в CSV...")
-        messagebox.showinfo("Экспорт", "История экспортирована в CSV!")
+        self._export_history(".csv")
+    
+    def _export_history(self, default_extension: str):
+        """
+        Экспорт отфильтрованной истории.
+        
+        Формат определяется расширением выбранного файла по таблице
+        _EXPORT_WRITERS; неизвестное расширение сохраняется как CSV.
+        """
+        if not self.filtered_history:
+            messagebox.showwarning("Экспорт", "Нет данных для экспорта")
+            return
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = filedialog.asksaveasfilename(
+            defaultextension=default_extension,
+            filetypes=[
+                ("CSV files", "*.csv"),
+                ("Excel files", "*.xlsx"),
+                ("JSON files", "*.json"),
+                ("All files", "*.*")
+            ],
+            initialfile=f"plex_history_{timestamp}{default_extension}"
+        )
+        
+        if not filename:
+            return
+        
+        writer_name = _EXPORT_WRITERS.get(Path(filename).suffix.lower(), '_export_history_to_csv')
+        self._start_export(getattr(self, writer_name), filename, self.filtered_history)
+    
+    def _export_history_to_csv(self, filename: str, history: List[HistoryEntry],
+                               progress: Optional[Callable[[int], None]] = None):
+        """
+        Запись истории в CSV файл.
+        
+        До _CSV_IN_MEMORY_LIMIT строк файл собирается в памяти и пишется
+        одним вызовом write; большие истории пишутся потоком через буфер.
+        """
+        rows = self._get_export_rows(history, progress)
+        
+        if len(history) <= _CSV_IN_MEMORY_LIMIT:
+            buffer = io.StringIO(newline='')
+            writer = csv.writer(buffer)
+            writer.writerow(_EXPORT_FIELDS)
+            writer.writerows(rows)
+            
+            with open_export(filename) as csvfile:
+                csvfile.write(buffer.getvalue())
+            return
+        
+        write_csv(filename, _EXPORT_FIELDS, rows)
     
     def _export_excel(self):
         """Экспорт в Excel."""
         logger.info("📊 Экспорт в Excel...")
-        messagebox.showinfo("Экспорт", "История экспортирована в Excel!")
+        self._export_history(".xlsx")
+    
+    def _export_history_to_excel(self, filename: str, history: List[HistoryEntry],
+                                 progress: Optional[Callable[[int], None]] = None):
+        """Запись истории в Excel файл."""
+        write_excel(filename, "История", _EXPORT_FIELDS, self._get_export_rows(history, progress))
+    
+    def _get_export_rows(self, history: List[HistoryEntry],
+                         progress: Optional[Callable[[int], None]] = None) -> Iterable[Tuple[Any, ...]]:
+        """
+        Строки экспорта с кэшем между экспортами одного и того же набора.
+        
+        Первый экспорт набора строит строки потоком и попутно запоминает их;
+        повторный экспорт (например, CSV, затем Excel) берет готовый список.
+        Ключ кэша - сам объект списка: фильтры и загрузка создают новый список.
+        
+        Вызывается из потока экспорта: кэш читается одним снимком кортежа,
+        а сохраняется через _store_export_rows в UI потоке.
+        """
+        source, cached_rows = self._export_rows
+        if history is source:
+            return cached_rows
+        
+        def collect():
+            rows = []
+            for row in _iter_export_rows(_iter_with_progress(history, progress)):
+                rows.append(row)
+                yield row
+            
+            self._post(self._store_export_rows, history, rows)
+        
+        return collect()
+    
+    def _store_export_rows(self, history: List[HistoryEntry], rows: List[Tuple[Any, ...]]):
+        """
+        Сохранение строк экспорта в кэш (в потоке UI).
+        
+        Строки сохраняются, только если экспортированный список все еще
+        текущий: экспорт, завершившийся после перезагрузки или смены фильтра,
+        не вытесняет кэш новых данных.
+        """
+        if history is self.filtered_history or history is self.current_history:
+            self._export_rows = (history, rows)
     
     def _export_pdf_report(self):
         """Экспорт отчета в PDF."""
@@ -585,7 +1241,109 @@ class EnhancedHistoryTab(ctk.CTkFrame):
     def _create_backup(self):
         """Создание бэкапа."""
         logger.info("💾 Создание бэкапа...")
-        messagebox.showinfo("Бэкап", "Бэкап истории создан!")
+        
+        if not self.current_history:
+            messagebox.showwarning("Бэкап", "Нет данных для бэкапа")
+            return
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+            initialfile=f"plex_history_backup_{timestamp}.json"
+        )
+        
+        if filename:
+            self._start_export(self._export_history_to_json, filename, self.current_history)
+    
+    def _export_history_to_json(self, filename: str, history: List[HistoryEntry],
+                                progress: Optional[Callable[[int], None]] = None):
+        """
+        Потоковая запись истории в JSON файл.
+        
+        Операции сериализуются блоками по _JSON_CHUNK_SIZE: один вызов dumps_json
+        на блок, а в памяти одновременно находится только один блок.
+        Формат файла совпадает с json.dump(..., indent=2): отступ
+        2 пробела на уровень.
+        """
+        operations = (
+            {
+                'id': item.id,
+                'timestamp': item.timestamp_iso,
+                'operation_type': item.operation_type,
+                'category': item.category,
+                'component': item.component,
+                'description': item.description,
+                'status': item.status,
+                'duration_ms': item.duration,
+                'details': item.details
+            }
+            for item in _iter_with_progress(history, progress)
+        )
+        
+        with open_export(filename, text=False) as f:
+            f.write(b'{\n  "exported_at": ' + dumps_json(datetime.now()))
+            f.write(b',\n  "count": ' + str(len(history)).encode())
+            f.write(b',\n  "operations": [')
+            
+            separator = b'\n'
+            while True:
+                chunk = list(islice(operations, _JSON_CHUNK_SIZE))
+                if not chunk:
+                    break
+                
+                # Список без внешних скобок "[\n" и "\n]", сдвинутый на уровень
+                # вглубь: переводы строк внутри значений JSON экранированы
+                f.write(separator)
+                f.write(b'  ' + dumps_json(chunk)[2:-2].replace(b'\n', b'\n  '))
+                separator = b',\n'
+            
+            f.write(b'\n  ]\n}\n' if separator == b',\n' else b']\n}\n')
+    
+    def _start_export(self, writer, filename: str, history: List[HistoryEntry]):
+        """
+        Запуск записи файла экспорта в фоновом потоке.
+        
+        Сериализация больших историй занимает секунды, поэтому writer
+        выполняется вне event loop, а результат показывается через after.
+        """
+        if self.exporting:
+            messagebox.showwarning("Экспорт", "Экспорт уже выполняется")
+            return
+        
+        self.exporting = True
+        self._show_status(f"⏳ Экспорт {len(history):,} записей...", 'info', timeout_ms=600000)
+        
+        total = len(history)
+        
+        def progress(done: int):
+            self._post(self._update_export_progress, done, total)
+        
+        future = self._export_executor.submit(writer, filename, history, progress)
+        future.add_done_callback(
+            lambda f: self._post(self._on_export_done, f, filename, len(history))
+        )
+    
+    def _update_export_progress(self, done: int, total: int):
+        """Обновление прогресса экспорта (в потоке UI)."""
+        if self.exporting and total:
+            self.progress_bar.set_progress(done / total, f"Экспорт: {done:,} из {total:,}")
+    
+    def _on_export_done(self, future, filename: str, count: int):
+        """Завершение экспорта (в потоке UI)."""
+        self.exporting = False
+        
+        error = future.exception()
+        if error:
+            logger.error(f"❌ Ошибка экспорта {filename}: {error}")
+            self._show_status("❌ Ошибка экспорта", 'failed')
+            messagebox.showerror("Ошибка экспорта", f"Не удалось экспортировать историю:\n{error}")
+            return
+        
+        logger.info(f"📄 Экспорт истории: {filename} ({count} записей)")
+        self.progress_bar.set_progress(1.0, "Экспорт завершен!")
+        self._show_status(f"✓ Экспортировано записей: {count:,}", 'success')
+        messagebox.showinfo("Экспорт", f"✅ История экспортирована в:\n{filename}")
     
     def _restore_backup(self):
         """Восстановление из бэкапа."""
@@ -600,30 +1358,79 @@ class EnhancedHistoryTab(ctk.CTkFrame):
     
     def _on_period_change(self, value):
         """Обработка изменения периода."""
+        if value == self._last_period:
+            return
+        
+        self._last_period = value
         logger.debug(f"📅 Период изменен на: {value}")
-        self._apply_filters()
+        self._schedule_filters()
+    
+    def _schedule_filters(self):
+        """Отложенное применение фильтров: серия изменений дает один пересчет."""
+        if self._filter_job:
+            self.after_cancel(self._filter_job)
+        
+        self._filter_job = self.after(_FILTER_DEBOUNCE_MS, self._apply_filters)
     
     def _apply_filters(self):
         """Применение фильтров."""
+        if self._filter_job:
+            self.after_cancel(self._filter_job)
+            self._filter_job = None
+        
         logger.debug("🔍 Применение фильтров...")
+        
+        now_minute = datetime.now().replace(second=0, microsecond=0)
+        start_date = _period_start(self.period_var.get(), now_minute)
+        selected_types = {key for key, var in self.operation_types.items() if var.get()}
+        
+        # Те же фильтры по той же истории дают ту же таблицу
+        filter_key = (start_date, frozenset(selected_types))
+        if filter_key == self._last_filter_key:
+            return
+        
+        # Начало отфильтрованного хвоста в каждой выбранной категории
+        self._filter_bounds = {
+            category: bisect_left(self._history_ts_keys[category], start_date) if start_date else 0
+            for category in selected_types
+            if category in self._history_by_category
+        }
+        
+        if start_date is None and selected_types.issuperset(self._history_by_category):
+            # Фильтры ничего не отсекают
+            self.filtered_history = self.current_history
+        else:
+            # Хвосты категорий после start_date, слитые по убыванию времени
+            tails = [
+                reversed(self._history_by_category[category][start:])
+                for category, start in self._filter_bounds.items()
+            ]
+            self.filtered_history = list(
+                heapq.merge(*tails, key=attrgetter('timestamp'), reverse=True)
+            )
+        
+        self._update_history_table()
+        self._update_statistics()
+        self._last_filter_key = filter_key
     
     def _select_all_types(self):
         """Выбор всех типов операций."""
         for var in self.operation_types.values():
             var.set(True)
-        self._apply_filters()
+        self._schedule_filters()
     
     def _select_no_types(self):
         """Снятие выбора всех типов."""
         for var in self.operation_types.values():
             var.set(False)
-        self._apply_filters()
+        self._schedule_filters()
     
     def _reset_filters(self):
         """Сброс всех фильтров."""
         logger.info("🔄 Сброс фильтров...")
         self.search_entry.delete(0, "end")
         self.period_var.set("7d")
+        self._last_period = "7d"
         self._select_all_types()
     
     def _apply_sorting(self, value):
@@ -640,6 +1447,19 @@ class EnhancedHistoryTab(ctk.CTkFrame):
         self.loading_history = False
         self.load_history_btn.configure(state="normal")
     
+    def destroy(self):
+        """Уничтожение вкладки с остановкой рабочего потока."""
+        self._destroyed = True
+        self.loading_history = False
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._export_executor.shutdown(wait=False, cancel_futures=True)
+        
+        for job in (self._filter_job, self._table_fill_job, self._status_clear_job):
+            if job:
+                self.after_cancel(job)
+        
+        super().destroy()
+    
     def set_history_manager(self, history_manager):
         """Установка менеджера истории."""
         self.history_manager = history_manager
@@ -6,24 +6,169 @@ PLEX Dynamic Staking Manager - Enhanced Rewards Tab
 Версия: 1.0.0
 """
 
-import asyncio
-import threading
-from datetime import datetime, timedelta
-from decimal import Decimal
-from typing import Dict, List, Optional, Any, Tuple
-import tkinter as tk
+import math
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from tkinter import messagebox, filedialog, ttk
 import customtkinter as ctk
 
 from ui.themes.dark_theme import get_theme
-from ui.components.progress_bar import ProgressBar, ProgressState
+from ui.components.progress_bar import ProgressBar
+from ui.components.worker_dispatch import WorkerDispatchMixin
+from utils.export_writers import EXCEL_AVAILABLE, dumps_json, open_export, write_csv, write_excel
 from utils.logger import get_logger
 from utils.widget_factory import SafeWidgetFactory
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Количество строк, добавляемых в таблицу за один проход event loop
+_TABLE_BATCH_SIZE = 500
+
+# Допустимый ввод в поле минимальной награды: цифры и одна точка
+_AMOUNT_INPUT_RE = re.compile(r'\d*\.?\d*')
+
+# Задержка фильтрации после последнего нажатия клавиши (мс)
+_FILTER_DEBOUNCE_MS = 180
+
+# Варианты сортировки: подпись -> (колонка, по убыванию)
+_SORT_OPTIONS = {
+    "По награде ↓": ('amount', True),
+    "По награде ↑": ('amount', False),
+    "По адресу": ('address', False),
+}
+
+# Цвет строки по тиру награды (тип статусного цвета темы)
+_TIER_COLORS = {
+    "Platinum": 'plex',
+    "Gold": 'warning',
+    "Silver": 'info',
+    "Bronze": 'success',
+}
+
+# Форматирование суммы награды для таблицы
+_format_reward = '{:,.2f}'.format
+
+# Статус награды до выплаты
+_STATUS_PENDING = "⏳ Ожидает"
+
+# Колонки экспорта наград
+_EXPORT_FIELDS = (
+    'address', 'category', 'reward_tier', 'base_reward', 'bonus_multiplier',
+    'final_reward', 'eligibility_score', 'distribution_date', 'notes'
+)
+
+# Поля RewardDistribution, выгружаемые без приведения (одним вызовом на C);
+# Decimal-суммы и дата берутся из колонок, приведенных при расчете
+_EXPORT_GETTER = attrgetter(
+    'participant_address', 'category', 'reward_tier', 'bonus_multiplier',
+    'eligibility_score', 'notes'
+)
+
+# Расширение файла -> (подпись в диалоге, метод записи экспорта);
+# форматы без установленной библиотеки не регистрируются
+_EXPORT_WRITERS = {}
+if PYARROW_AVAILABLE:
+    _EXPORT_WRITERS['.parquet'] = ("Parquet files", '_export_rewards_to_parquet')
+    _EXPORT_WRITERS['.feather'] = ("Feather files", '_export_rewards_to_feather')
+if EXCEL_AVAILABLE:
+    _EXPORT_WRITERS['.xlsx'] = ("Excel files", '_export_rewards_to_excel')
+_EXPORT_WRITERS['.csv'] = ("CSV files", '_export_rewards_to_csv')
+_EXPORT_WRITERS['.json'] = ("JSON files", '_export_rewards_to_json')
+
+
+def _iter_export_rows(rewards: List[Any], indices: List[int],
+                      columns: Dict[str, Any]) -> Iterator[Tuple[Any, ...]]:
+    """
+    Строки экспорта наград в порядке _EXPORT_FIELDS.
+    
+    rewards - отфильтрованные награды, indices - их индексы в колонках.
+    Decimal-суммы выгружаются строками без потери точности,
+    как в RewardManager.export_distributions.
+    """
+    base_text = columns['base_reward_text']
+    final_text = columns['final_reward_text']
+    date_text = columns['date_text']
+    
+    for index, (address, category, tier, multiplier, score, notes) in zip(
+            indices, map(_EXPORT_GETTER, rewards)):
+        yield (
+            address, category, tier, base_text[index], multiplier,
+            final_text[index], score, date_text[index], notes,
+        )
+
+
+def _build_reward_columns(rewards: List[Any]) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    Построение колонок наград для фильтрации и сортировки.
+    
+    Суммы, адреса в нижнем регистре и ранг адреса вычисляются один раз
+    при загрузке; фильтр и сортировка работают с колонками по индексам,
+    не обращаясь к атрибутам объектов наград.
+    
+    Returns:
+        Tuple[List[str], Dict[str, Any]]: Адреса в нижнем регистре и колонки
+    """
+    addresses_lower = [d.participant_address.lower() for d in rewards]
+    
+    amounts = [float(d.final_reward) for d in rewards]
+    amount_text = list(map(_format_reward, amounts))
+    address_rank = [0] * len(rewards)
+    by_address = sorted(range(len(rewards)), key=lambda i: rewards[i].participant_address)
+    for rank, index in enumerate(by_address):
+        address_rank[index] = rank
+    
+    if NUMPY_AVAILABLE:
+        amounts = np.asarray(amounts, dtype=np.float64)
+        address_rank = np.asarray(address_rank, dtype=np.int64)
+    
+    # Приведение Decimal и дат для экспорта выполняется здесь один раз;
+    # кортежи строк экспорта собираются только при экспорте
+    return addresses_lower, {
+        'amount': amounts,
+        'amount_text': amount_text,
+        'address': address_rank,
+        'base_reward_text': [str(d.base_reward) for d in rewards],
+        'final_reward_text': [str(d.final_reward) for d in rewards],
+        'date_text': [d.distribution_date.isoformat() for d in rewards],
+    }
+
 
-class EnhancedRewardsTab(ctk.CTkFrame):
+def _find_duplicate_addresses(addresses_lower: List[str]) -> List[str]:
+    """
+    Адреса, встречающиеся в списке наград более одного раза.
+    
+    Один проход с множеством просмотренных адресов: O(n) вместо
+    попарного сравнения. Каждый дубликат возвращается один раз.
+    """
+    seen = set()
+    duplicates = {}
+    for address in addresses_lower:
+        if address in seen:
+            duplicates[address] = None
+        else:
+            seen.add(address)
+    return list(duplicates)
+
+
+class EnhancedRewardsTab(WorkerDispatchMixin, ctk.CTkFrame):
     """
     Расширенная вкладка управления наградами.
     
@@ -60,7 +205,22 @@ class EnhancedRewardsTab(ctk.CTkFrame):
         # Данные наград
         self.current_rewards = []
         self.filtered_rewards = []
+        # Пустые колонки того же типа, что и после расчета (numpy или списки)
+        self._reward_addresses_lower, self._reward_columns = _build_reward_columns([])
+        self._filtered_indices = []
+        self._filtered_total = 0.0
+        self._filtered_amount_text = []
         self.calculation_running = False
+        self._table_fill_job = None
+        self._row_iids = []
+        self._filter_after_id = None
+        self._duplicate_addresses = []
+        # (отфильтрованный список, его строки экспорта)
+        self._export_rows = (None, [])
+        
+        # Общий пул фоновых действий вкладки (расчет, экспорт);
+        # результаты возвращаются в UI поток через after
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='rewards')
         
         # Создание интерфейса
         self._create_widgets()
@@ -160,9 +320,55 @@ class EnhancedRewardsTab(ctk.CTkFrame):
                 self.stats_frame, "Средняя награда", "0 PLEX", "success"
             )
             
+            # Прямые ссылки на значения карточек для обновления статистики
+            self.total_rewards_value = self.total_rewards_card['value']
+            self.total_recipients_value = self.total_recipients_card['value']
+            self.avg_reward_value = self.avg_reward_card['value']
+            
+            # Фильтры таблицы
+            self.filter_frame = ctk.CTkFrame(self.results_frame)
+            self.filter_frame.configure(fg_color="transparent")
+            
+            self.search_label = ctk.CTkLabel(
+                self.filter_frame,
+                text="🔍 Адрес:",
+                text_color=self.theme.colors['text_secondary']
+            )
+            self.search_entry = self.widget_factory.create_entry(
+                self.filter_frame,
+                width=300
+            )
+            self.search_entry.bind('<KeyRelease>', self._on_filter_changed)
+            
+            self.min_reward_label = ctk.CTkLabel(
+                self.filter_frame,
+                text="Мин. награда (PLEX):",
+                text_color=self.theme.colors['text_secondary']
+            )
+            self.min_reward_entry = self.widget_factory.create_entry(
+                self.filter_frame,
+                width=120
+            )
+            self.min_reward_entry.configure(
+                validate='key',
+                validatecommand=(self.register(self._is_amount_input), '%P')
+            )
+            self.min_reward_entry.bind('<KeyRelease>', self._on_filter_changed)
+            
+            self.sort_var = ctk.StringVar(value=next(iter(_SORT_OPTIONS)))
+            self.sort_menu = ctk.CTkOptionMenu(
+                self.filter_frame,
+                values=list(_SORT_OPTIONS),
+                variable=self.sort_var,
+                command=lambda _value: self._apply_filters(),
+                width=160
+            )
+            
             # Таблица наград
+            self.tree_frame = ctk.CTkFrame(self.results_frame)
+            
             self.rewards_tree = ttk.Treeview(
-                self.results_frame,
+                self.tree_frame,
                 columns=("address", "category", "tier", "reward", "status"),
                 show="headings",
                 height=15
@@ -175,15 +381,23 @@ class EnhancedRewardsTab(ctk.CTkFrame):
             self.rewards_tree.heading("reward", text="Награда (PLEX)")
             self.rewards_tree.heading("status", text="Статус")
             
+            # Растягивается только адрес: ширины остальных колонок
+            # не пересчитываются при каждом изменении размера окна
             self.rewards_tree.column("address", width=300)
-            self.rewards_tree.column("category", width=120)
-            self.rewards_tree.column("tier", width=80)
-            self.rewards_tree.column("reward", width=150)
-            self.rewards_tree.column("status", width=100)
+            self.rewards_tree.column("category", width=120, stretch=False)
+            self.rewards_tree.column("tier", width=80, stretch=False)
+            self.rewards_tree.column("reward", width=150, stretch=False)
+            self.rewards_tree.column("status", width=100, stretch=False)
+            
+            # Цвета тиров разрешаются один раз: строки ссылаются на тег
+            for tier, color_type in _TIER_COLORS.items():
+                self.rewards_tree.tag_configure(
+                    tier, foreground=self.theme.get_status_color(color_type)
+                )
             
             # Скроллбар для таблицы
             self.tree_scrollbar = ttk.Scrollbar(
-                self.results_frame,
+                self.tree_frame,
                 orient="vertical",
                 command=self.rewards_tree.yview
             )
@@ -290,12 +504,21 @@ class EnhancedRewardsTab(ctk.CTkFrame):
             self.stats_frame.grid_columnconfigure(1, weight=1)
             self.stats_frame.grid_columnconfigure(2, weight=1)
             
+            # Фильтры
+            self.filter_frame.pack(fill="x", padx=10, pady=(5, 0))
+            self.search_label.pack(side="left", padx=(10, 5))
+            self.search_entry.pack(side="left", padx=5)
+            self.min_reward_label.pack(side="left", padx=(20, 5))
+            self.min_reward_entry.pack(side="left", padx=5)
+            self.sort_menu.pack(side="right", padx=10)
+            
             # Таблица наград
-            tree_frame = ctk.CTkFrame(self.results_frame)
-            tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
+            self.tree_frame.pack(fill="both", expand=True, padx=10, pady=10)
+            self.tree_frame.grid_rowconfigure(0, weight=1)
+            self.tree_frame.grid_columnconfigure(0, weight=1)
             
-            self.rewards_tree.pack(side="left", fill="both", expand=True)
-            self.tree_scrollbar.pack(side="right", fill="y")
+            self.rewards_tree.grid(row=0, column=0, sticky="nsew")
+            self.tree_scrollbar.grid(row=0, column=1, sticky="ns")
             
             # Кнопки управления
             self.control_frame.pack(fill="x", padx=20, pady=10)
@@ -317,55 +540,356 @@ class EnhancedRewardsTab(ctk.CTkFrame):
                 messagebox.showwarning("Предупреждение", "RewardManager не инициализирован")
                 return
             
-            # Заглушка для расчета наград
-            self.progress_bar.set_state(ProgressState.LOADING)
-            self.progress_bar.set_text("Расчет наград...")
+            if self.calculation_running:
+                return
+            
+            self.calculation_running = True
+            self.calculate_button.configure(state="disabled")
+            self.progress_bar.set_progress(0.0, "Расчет наград...")
             
-            # Здесь будет реальная логика расчета наград
             logger.info("🧮 Начат расчет наград")
             
-            # Имитация расчета
-            self.after(2000, self._on_calculation_complete)
+            # Снимок списка берется в UI потоке: worker не читает состояние менеджера
+            rewards = list(self.reward_manager.distributions)
+            self._executor.submit(self._run_calculation, rewards)
             
         except Exception as e:
             logger.error(f"Ошибка расчета наград: {e}")
             messagebox.showerror("Ошибка", f"Ошибка при расчете наград: {e}")
-            self.progress_bar.set_state(ProgressState.ERROR)
+            self._on_calculation_failed(str(e))
     
-    def _on_calculation_complete(self) -> None:
+    def _run_calculation(self, rewards: List[Any]) -> None:
+        """
+        Подготовка наград к отображению в фоновом потоке.
+        
+        Вкладка показывает распределения, уже рассчитанные
+        RewardManager.calculate_rewards: участников и пула наград у вкладки
+        нет, поэтому сам расчет здесь не запускается. Виджеты здесь
+        не трогаются: результат передается в UI поток через after.
+        """
+        try:
+            addresses_lower, columns = _build_reward_columns(rewards)
+            duplicates = _find_duplicate_addresses(addresses_lower)
+            
+            self._post(self._on_calculation_complete, rewards, addresses_lower, columns, duplicates)
+            
+        except Exception as e:
+            logger.error(f"Ошибка расчета наград: {e}")
+            self._post(self._on_calculation_failed, str(e))
+    
+    def _apply_progress(self, value: float, message: str) -> None:
+        """Обновление прогресса расчета в UI потоке."""
+        if self.calculation_running:
+            self.progress_bar.set_progress(value, message)
+    
+    def _on_calculation_failed(self, message: str) -> None:
+        """Обработка ошибки расчета наград в UI потоке."""
+        self.calculation_running = False
+        self.calculate_button.configure(state="normal")
+        self.progress_bar.error(message)
+    
+    def _on_calculation_complete(self, rewards: List[Any], addresses_lower: List[str],
+                                 columns: Dict[str, Any], duplicates: List[str]) -> None:
         """Завершение расчета наград."""
         try:
-            self.progress_bar.set_state(ProgressState.SUCCESS)
-            self.progress_bar.set_text("Расчет завершен")
+            self.calculation_running = False
+            self.calculate_button.configure(state="normal")
+            
+            self.current_rewards = rewards
+            self._reward_addresses_lower = addresses_lower
+            self._reward_columns = columns
+            self._duplicate_addresses = duplicates
+            self._apply_filters()
+            
+            if duplicates:
+                logger.warning(f"⚠️ Повторяющиеся адреса в наградах: {len(duplicates)}")
+            
+            self.progress_bar.set_progress(1.0, "Расчет завершен")
             
             # Активация кнопок экспорта и распределения
-            self.export_button.configure(state="normal")
-            self.distribute_button.configure(state="normal")
+            has_rewards = "normal" if self.current_rewards else "disabled"
+            self.export_button.configure(state=has_rewards)
+            self.distribute_button.configure(state=has_rewards)
             
-            logger.info("✅ Расчет наград завершен")
+            logger.info(f"✅ Расчет наград завершен: {len(self.current_rewards)} получателей")
             
         except Exception as e:
             logger.error(f"Ошибка завершения расчета: {e}")
     
+    @staticmethod
+    def _is_amount_input(text: str) -> bool:
+        """Проверка ввода в поле минимальной награды (validatecommand)."""
+        return _AMOUNT_INPUT_RE.fullmatch(text) is not None
+    
+    def _on_filter_changed(self, event=None) -> None:
+        """
+        Обработка ввода в полях фильтров.
+        
+        Фильтрация откладывается до паузы в наборе: серия нажатий клавиш
+        дает один проход фильтра и сортировки вместо прохода на символ.
+        """
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        
+        self._filter_after_id = self.after(_FILTER_DEBOUNCE_MS, self._apply_filters)
+    
+    def _filter_reward_indices(self, search_text: str, min_reward: float,
+                               column: str, reverse: bool) -> List[int]:
+        """Индексы наград, прошедших фильтр, в порядке сортировки."""
+        amounts = self._reward_columns['amount']
+        sort_values = self._reward_columns[column]
+        addresses = self._reward_addresses_lower
+        
+        if NUMPY_AVAILABLE:
+            mask = amounts >= min_reward
+            if search_text:
+                mask &= np.fromiter(
+                    (search_text in address for address in addresses),
+                    dtype=bool, count=len(addresses)
+                )
+            indices = np.flatnonzero(mask)
+            values = sort_values[indices]
+            # Убывание через отрицание, а не разворот: равные значения
+            # сохраняют исходный порядок, как при list.sort(reverse=True)
+            order = np.argsort(-values if reverse else values, kind='stable')
+            return indices[order].tolist()
+        
+        indices = [
+            i for i, amount in enumerate(amounts)
+            if amount >= min_reward and (not search_text or search_text in addresses[i])
+        ]
+        indices.sort(key=sort_values.__getitem__, reverse=reverse)
+        return indices
+    
+    def _apply_filters(self) -> None:
+        """
+        Фильтрация и сортировка наград.
+        
+        Во время расчета фильтр не применяется: по завершении расчета
+        _on_calculation_complete применяет текущие фильтры к новым данным.
+        """
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        
+        if self.calculation_running:
+            return
+        
+        search_text = self.search_entry.get().strip().lower()
+        
+        # Валидатор пропускает только цифры и одну точку
+        min_reward_text = self.min_reward_entry.get()
+        min_reward = float(min_reward_text) if min_reward_text.strip('.') else 0.0
+        
+        column, reverse = _SORT_OPTIONS[self.sort_var.get()]
+        indices = self._filter_reward_indices(search_text, min_reward, column, reverse)
+        
+        rewards = self.current_rewards
+        self._filtered_indices = indices
+        self.filtered_rewards = [rewards[i] for i in indices]
+        
+        # Сумма для статистики считается один раз на фильтр
+        amounts = self._reward_columns['amount']
+        if NUMPY_AVAILABLE:
+            self._filtered_total = float(amounts[indices].sum()) if indices else 0.0
+        else:
+            self._filtered_total = math.fsum(amounts[i] for i in indices)
+        
+        amount_text = self._reward_columns['amount_text']
+        self._filtered_amount_text = [amount_text[i] for i in indices]
+        self._update_rewards_table()
+        self._update_statistics()
+    
+    def _update_rewards_table(self) -> None:
+        """
+        Обновление таблицы наград.
+        
+        Treeview отрисовывает только видимые строки, поэтому таблица
+        показывает все награды без ограничения количества. Существующие
+        строки переиспользуются (меняются только значения), лишние
+        удаляются, недостающие добавляются пачками.
+        """
+        if self._table_fill_job:
+            self.after_cancel(self._table_fill_job)
+            self._table_fill_job = None
+        
+        need = len(self.filtered_rewards)
+        if len(self._row_iids) > need:
+            self.rewards_tree.delete(*self._row_iids[need:])
+            del self._row_iids[need:]
+        
+        self._fill_reward_rows(0)
+    
+    def _fill_reward_rows(self, start: int) -> None:
+        """Порционное заполнение таблицы наград."""
+        end = min(start + _TABLE_BATCH_SIZE, len(self.filtered_rewards))
+        existing = len(self._row_iids)
+        amount_text = self._filtered_amount_text
+        
+        for index in range(start, end):
+            distribution = self.filtered_rewards[index]
+            values = (
+                distribution.participant_address,
+                distribution.category,
+                distribution.reward_tier,
+                amount_text[index],
+                _STATUS_PENDING
+            )
+            
+            tags = (distribution.reward_tier,)
+            
+            if index < existing:
+                self.rewards_tree.item(self._row_iids[index], values=values, tags=tags)
+            else:
+                self._row_iids.append(
+                    self.rewards_tree.insert("", "end", values=values, tags=tags)
+                )
+        
+        if end < len(self.filtered_rewards):
+            self._table_fill_job = self.after(1, self._fill_reward_rows, end)
+        else:
+            self._table_fill_job = None
+    
+    def _update_statistics(self) -> None:
+        """
+        Обновление карточек статистики наград.
+        
+        Карточки только отображают суммы, поэтому считаются по float-колонке;
+        точные Decimal-значения остаются в RewardDistribution для выплаты.
+        """
+        total = self._filtered_total
+        count = len(self.filtered_rewards)
+        average = total / count if count else 0
+        
+        self.total_rewards_value.configure(text=f"{total:,.0f} PLEX")
+        self.total_recipients_value.configure(text=f"{count:,}")
+        self.avg_reward_value.configure(text=f"{average:,.0f} PLEX")
+    
     def _export_rewards(self) -> None:
-        """Экспорт списка наград."""
+        """
+        Экспорт списка наград.
+        
+        Формат определяется расширением выбранного файла по таблице
+        _EXPORT_WRITERS; неизвестное расширение сохраняется как CSV.
+        """
+        if not self.filtered_rewards:
+            messagebox.showwarning("Экспорт", "Нет данных для экспорта")
+            return
+        
         try:
             filename = filedialog.asksaveasfilename(
-                defaultextension=".xlsx",
-                filetypes=[("Excel files", "*.xlsx"), ("CSV files", "*.csv")]
+                defaultextension=next(iter(_EXPORT_WRITERS)),
+                filetypes=[(label, f"*{ext}") for ext, (label, _) in _EXPORT_WRITERS.items()]
             )
             
-            if filename:
-                logger.info(f"📄 Экспорт наград в файл: {filename}")
-                messagebox.showinfo("Успех", "Список наград экспортирован")
+            if not filename:
+                return
+            
+            logger.info(f"📄 Экспорт наград в файл: {filename}")
+            
+            extension = os.path.splitext(filename)[1].lower()
+            _, writer_name = _EXPORT_WRITERS.get(extension, _EXPORT_WRITERS['.csv'])
+            
+            rows = self._get_export_rows()
+            
+            self.export_button.configure(state="disabled")
+            self.progress_bar.set_progress(0.0, "Экспорт наград...")
+            self._executor.submit(self._run_export, getattr(self, writer_name), filename, rows)
                 
         except Exception as e:
             logger.error(f"Ошибка экспорта наград: {e}")
             messagebox.showerror("Ошибка", f"Ошибка при экспорте: {e}")
     
+    def _run_export(self, writer: Callable[[str, List[Tuple[Any, ...]]], None],
+                    filename: str, rows: List[Tuple[Any, ...]]) -> None:
+        """Запись файла экспорта в фоновом потоке."""
+        try:
+            writer(filename, rows)
+            self._post(self._on_export_done, len(rows), None)
+            
+        except Exception as e:
+            logger.error(f"Ошибка экспорта наград: {e}")
+            self._post(self._on_export_done, len(rows), str(e))
+    
+    def _on_export_done(self, count: int, error: Optional[str]) -> None:
+        """Завершение экспорта в UI потоке."""
+        self.export_button.configure(state="normal")
+        
+        if error:
+            self.progress_bar.error(error)
+            messagebox.showerror("Ошибка", f"Ошибка при экспорте: {error}")
+            return
+        
+        self.progress_bar.set_progress(1.0, "Экспорт завершен")
+        messagebox.showinfo("Успех", f"Экспортировано наград: {count}")
+    
+    def _get_export_rows(self) -> List[Tuple[Any, ...]]:
+        """
+        Строки экспорта отфильтрованных наград.
+        
+        Кортежи строк собираются только для отфильтрованных наград из
+        колонок, приведенных при расчете. Список кэшируется по объекту
+        filtered_rewards: повторный экспорт в другой формат берет готовый список.
+        """
+        source, rows = self._export_rows
+        if source is self.filtered_rewards:
+            return rows
+        
+        rows = list(_iter_export_rows(self.filtered_rewards, self._filtered_indices,
+                                      self._reward_columns))
+        self._export_rows = (self.filtered_rewards, rows)
+        return rows
+    
+    def _get_export_table(self, rows: List[Tuple[Any, ...]]) -> 'pa.Table':
+        """Arrow-таблица из строк экспорта."""
+        columns = list(zip(*rows)) if rows else [()] * len(_EXPORT_FIELDS)
+        return pa.table({field: list(column) for field, column in zip(_EXPORT_FIELDS, columns)})
+    
+    def _export_rewards_to_parquet(self, filename: str, rows: List[Tuple[Any, ...]]) -> None:
+        """Экспорт наград в Parquet (сжатие zstd)."""
+        pq.write_table(self._get_export_table(rows), filename, compression='zstd')
+    
+    def _export_rewards_to_feather(self, filename: str, rows: List[Tuple[Any, ...]]) -> None:
+        """Экспорт наград в Feather (сжатие zstd)."""
+        feather.write_feather(self._get_export_table(rows), filename, compression='zstd')
+    
+    def _export_rewards_to_excel(self, filename: str, rows: List[Tuple[Any, ...]]) -> None:
+        """Экспорт наград в Excel."""
+        write_excel(filename, "Rewards", _EXPORT_FIELDS, rows)
+    
+    def _export_rewards_to_json(self, filename: str, rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Экспорт наград в JSON.
+        
+        Документ сериализуется в байты одним вызовом dumps_json
+        и пишется одной записью.
+        """
+        payload = {
+            'export_time': datetime.now().isoformat(),
+            'total_rewards': len(rows),
+            'rewards': [dict(zip(_EXPORT_FIELDS, row)) for row in rows],
+        }
+        
+        with open_export(filename, text=False) as f:
+            f.write(dumps_json(payload))
+    
+    def _export_rewards_to_csv(self, filename: str, rows: List[Tuple[Any, ...]]) -> None:
+        """Экспорт наград в CSV."""
+        write_csv(filename, _EXPORT_FIELDS, rows)
+    
     def _distribute_rewards(self) -> None:
         """Распределение наград участникам."""
         try:
+            if self._duplicate_addresses:
+                preview = "\n".join(self._duplicate_addresses[:5])
+                messagebox.showwarning(
+                    "Дубликаты",
+                    f"Адреса встречаются в списке наград несколько раз: "
+                    f"{len(self._duplicate_addresses)}\n\n{preview}\n\n"
+                    "Распределение остановлено во избежание двойных выплат."
+                )
+                return
+            
             result = messagebox.askyesno(
                 "Подтверждение",
                 "Вы уверены, что хотите начать распределение наград?\n"
@@ -388,3 +912,16 @@ class EnhancedRewardsTab(ctk.CTkFrame):
             
         except Exception as e:
             logger.error(f"Ошибка обновления данных EnhancedRewardsTab: {e}")
+    
+    def destroy(self) -> None:
+        """Освобождение ресурсов вкладки."""
+        self._destroyed = True
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+        if self._table_fill_job:
+            self.after_cancel(self._table_fill_job)
+            self._table_fill_job = None
+        
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
@@ -15,15 +15,166 @@ import tkinter as tk
 from tkinter import messagebox, filedialog, ttk
 import customtkinter as ctk
 import os
+import copy
+import hashlib
 import json
+from functools import lru_cache
 
 from ui.themes.dark_theme import get_theme
 from ui.components.progress_bar import ProgressBar, ProgressState
 from utils.logger import get_logger
 from utils.widget_factory import SafeWidgetFactory
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Задержка отметки изменений после последнего нажатия клавиши (мс)
+_DIRTY_DEBOUNCE_MS = 250
+# Задержка автосохранения после последнего изменения (мс)
+_AUTOSAVE_DEBOUNCE_MS = 500
+
+# Поля ввода настроек: путь 'секция.ключ' -> (тип, значение по умолчанию,
+# placeholder, ширина). Порядок задает порядок применения и сохранения.
+_ENTRY_SCHEMA: Dict[str, Tuple[type, Any, str, int]] = {
+    'blockchain.rpc_url': (str, '', "https://your-endpoint.bsc.quicknode.pro/...", 400),
+    'blockchain.batch_size': (int, 100, "100", 80),
+    'blockchain.timeout': (int, 30, "30", 80),
+    'blockchain.retries': (int, 3, "3", 80),
+    'analysis.plex_contract': (str, '', "0x...", 350),
+    'analysis.usdt_contract': (str, '', "0x...", 350),
+    'analysis.min_volume': (float, 100, "100", 100),
+    'analysis.max_participants': (int, 1000, "1000", 100),
+    'analysis.cache_ttl': (int, 60, "60", 80),
+    'logging.max_log_size': (int, 100, "100", 80),
+    'logging.log_retention': (int, 30, "30", 80),
+    'backup.backup_interval': (int, 24, "24", 80),
+    'backup.backup_path': (str, './backups', "./backups", 300),
+    'backup.backup_retention': (int, 7, "7", 80),
+}
+
+# Публичные RPC BSC для быстрого выбора (QuickNode добавляется из .env)
+_RPC_PRESETS_BASE = (
+    ("BSC Official RPC", "https://bsc-dataseed.binance.org/"),
+    ("BSC RPC 1", "https://bsc-dataseed1.binance.org/"),
+    ("BSC RPC 2", "https://bsc-dataseed2.binance.org/"),
+    ("1RPC BSC", "https://1rpc.io/bnb"),
+    ("Ankr BSC", "https://rpc.ankr.com/bsc"),
+    ("Пользовательский", ""),
+)
+
+
+def _loads_settings(data: bytes) -> Any:
+    """Разбор JSON настроек из байтов (orjson, если доступен)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _dumps_settings(obj: Any) -> bytes:
+    """Сериализация настроек в JSON с отступом в 2 пробела."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+_ENV_FILE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
+
+
+@lru_cache(maxsize=4)
+def _parse_env_file(env_file_path: str, mtime: Optional[float]) -> Dict[str, str]:
+    """
+    Разбор .env файла.
+    
+    mtime входит в ключ кэша: после изменения файла он будет перечитан.
+    """
+    env_vars = {}
+    
+    try:
+        if mtime is not None:
+            with open(env_file_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#') and '=' in line:
+                        key, value = line.split('=', 1)
+                        env_vars[key.strip()] = value.strip()
+        else:
+            logger.warning(f"⚠️ Файл .env не найден: {env_file_path}")
+    except Exception as e:
+        logger.error(f"❌ Ошибка загрузки .env файла: {e}")
+    
+    return env_vars
+
+
+def _env_file_mtime() -> Optional[float]:
+    """Время изменения .env файла или None, если файла нет."""
+    try:
+        return os.stat(_ENV_FILE_PATH).st_mtime
+    except OSError:
+        return None
+
+
+def _read_env_file() -> Dict[str, str]:
+    """Переменные из .env файла проекта (кэш по времени изменения файла)."""
+    return _parse_env_file(_ENV_FILE_PATH, _env_file_mtime())
+
+
+def _settings_hash(blob: bytes) -> bytes:
+    """Короткий хэш сериализованных настроек для проверки изменений."""
+    return hashlib.blake2b(blob, digest_size=16).digest()
+
+
+@lru_cache(maxsize=1)
+def _build_default_settings(mtime: Optional[float]) -> Dict[str, Any]:
+    """Шаблон настроек по умолчанию для данной версии .env файла."""
+    env_vars = _parse_env_file(_ENV_FILE_PATH, mtime)
+    
+    return {
+        'blockchain': {
+            'rpc_url': env_vars.get('QUICKNODE_HTTP', ''),
+            'wss_url': env_vars.get('QUICKNODE_WSS', ''),
+            'api_key': env_vars.get('QUICKNODE_API_KEY', ''),
+            'network': 'BSC_MAINNET',
+            'batch_size': int(env_vars.get('MAX_BLOCKS_PER_CHUNK', 100)),
+            'timeout': 30,
+            'retries': 3
+        },
+        'analysis': {
+            'plex_contract': env_vars.get('TOKEN_ADDRESS', '0xdf179b6cAdBC61FFD86A3D2e55f6d6e083ade6c1'),
+            'usdt_contract': env_vars.get('USDT_BSC', '0x55d398326f99059fF775485246999027B3197955'),
+            'min_volume': float(env_vars.get('MIN_BALANCE', 100)),
+            'max_participants': 1000,
+            'cache_enabled': True,
+            'cache_ttl': 60,
+            'daily_purchase_min': float(env_vars.get('DAILY_PURCHASE_MIN', 2.8)),
+            'daily_purchase_max': float(env_vars.get('DAILY_PURCHASE_MAX', 3.2))
+        },
+        'logging': {
+            'level': env_vars.get('LOG_LEVEL', 'INFO'),
+            'max_log_size': 100,
+            'log_retention': 30,
+            'console_logging': True,
+            'log_file': env_vars.get('LOG_FILE', 'logs/plex_staking.log')
+        },
+        'backup': {
+            'auto_backup': True,
+            'backup_interval': 24,
+            'backup_path': './backups',
+            'backup_retention': 7
+        },
+        'interface': {
+            'theme': env_vars.get('THEME', 'dark'),
+            'language': 'ru',
+            'notifications': True,
+            'sound_notifications': False,
+            'autosave': True
+        }
+    }
+
 
 class SettingsTab(ctk.CTkFrame):
     """
@@ -50,6 +201,14 @@ class SettingsTab(ctk.CTkFrame):
         self.theme = get_theme()
         self.widget_factory = widget_factory or SafeWidgetFactory(self.theme)
         
+        # Стили виджетов вкладки: словари строятся один раз и переиспользуются
+        self._styles = {
+            'frame_primary': self.theme.get_frame_style('primary'),
+            'frame_card': self.theme.get_frame_style('card'),
+            'btn_secondary': self.theme.get_button_style('secondary'),
+            'switch': self.theme.get_switch_style(),
+        }
+        
         # Применение стиля фрейма
         frame_style = self.theme.get_frame_style('primary')
         frame_style.update(kwargs)
@@ -61,11 +220,24 @@ class SettingsTab(ctk.CTkFrame):
         # Текущие настройки
         self.current_settings = {}
         self.unsaved_changes = False
-        
-        # Создание интерфейса
+        # Состояние, отображаемое в changes_label (метка создается "сохранено")
+        self._shown_unsaved = False
+        self._dirty_after_id = None
+        self._save_after_id = None
+        # Хэш последнего записанного/прочитанного содержимого app_settings.json
+        self._last_saved_hash: Optional[bytes] = None
+        # Признак программного заполнения виджетов (не изменение пользователем)
+        self._applying = False
+        self._sections_built = False
+        # Поля ввода по ключу 'секция.ключ' (см. _ENTRY_SCHEMA)
+        self._entries: Dict[str, ctk.CTkEntry] = {}
+        
+        # Создание интерфейса: секции настроек (~80 виджетов) строятся
+        # в первом простое event loop, а не на пути запуска приложения
         self._create_widgets()
         self._setup_layout()
         self._load_current_settings()
+        self.after_idle(self._ensure_sections_built)
         
         logger.debug("⚙️ SettingsTab инициализирована")
     
@@ -78,15 +250,8 @@ class SettingsTab(ctk.CTkFrame):
             'title'
         )
         
-        # Создание основных секций настроек
-        self._create_blockchain_settings()
-        self._create_analysis_settings()
-        self._create_logging_settings()
-        self._create_backup_settings()
-        self._create_interface_settings()
-        
         # Кнопки управления
-        self.control_frame = self.theme.create_styled_frame(self, 'card')
+        self.control_frame = ctk.CTkFrame(self, **self._styles['frame_card'])
         
         self.save_button = self.theme.create_styled_button(
             self.control_frame,
@@ -128,7 +293,7 @@ class SettingsTab(ctk.CTkFrame):
         )
         
         # Статус изменений
-        self.status_frame = self.theme.create_styled_frame(self.control_frame, 'primary')
+        self.status_frame = ctk.CTkFrame(self.control_frame, **self._styles['frame_primary'])
         
         self.changes_label = self.theme.create_styled_label(
             self.status_frame,
@@ -137,9 +302,17 @@ class SettingsTab(ctk.CTkFrame):
         )
         self.changes_label.configure(text_color=self.theme.get_status_color('success'))
     
+    def _create_entry(self, parent, key: str) -> ctk.CTkEntry:
+        """Создание поля ввода настройки по схеме _ENTRY_SCHEMA."""
+        placeholder, width = _ENTRY_SCHEMA[key][2:]
+        entry = self.theme.create_styled_entry(parent, placeholder=placeholder, width=width)
+        entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._entries[key] = entry
+        return entry
+    
     def _create_blockchain_settings(self) -> None:
         """Создание секции настроек блокчейна."""
-        self.blockchain_frame = self.theme.create_styled_frame(self, 'card')
+        self.blockchain_frame = ctk.CTkFrame(self, **self._styles['frame_card'])
         
         self.blockchain_title = self.theme.create_styled_label(
             self.blockchain_frame,
@@ -147,7 +320,7 @@ class SettingsTab(ctk.CTkFrame):
             'subtitle'
         )
           # QuickNode RPC URL
-        self.rpc_frame = self.theme.create_styled_frame(self.blockchain_frame, 'primary')
+        self.rpc_frame = ctk.CTkFrame(self.blockchain_frame, **self._styles['frame_primary'])
         
         self.rpc_label = self.theme.create_styled_label(
             self.rpc_frame,
@@ -156,7 +329,7 @@ class SettingsTab(ctk.CTkFrame):
         )
         
         # Предустановленные RPC ноды
-        self.preset_rpc_frame = self.theme.create_styled_frame(self.rpc_frame, 'primary')
+        self.preset_rpc_frame = ctk.CTkFrame(self.rpc_frame, **self._styles['frame_primary'])
         
         self.preset_rpc_label = self.theme.create_styled_label(
             self.preset_rpc_frame,
@@ -165,13 +338,8 @@ class SettingsTab(ctk.CTkFrame):
         )
         
         self.rpc_presets = {
-            "QuickNode (Настроенный)": os.getenv('QUICKNODE_HTTP', ''),
-            "BSC Official RPC": "https://bsc-dataseed.binance.org/",
-            "BSC RPC 1": "https://bsc-dataseed1.binance.org/",
-            "BSC RPC 2": "https://bsc-dataseed2.binance.org/",
-            "1RPC BSC": "https://1rpc.io/bnb",
-            "Ankr BSC": "https://rpc.ankr.com/bsc",
-            "Пользовательский": ""
+            "QuickNode (Настроенный)": _read_env_file().get('QUICKNODE_HTTP', ''),
+            **dict(_RPC_PRESETS_BASE)
         }
         
         self.rpc_preset_var = ctk.StringVar(value="QuickNode (Настроенный)")
@@ -180,15 +348,10 @@ class SettingsTab(ctk.CTkFrame):
             values=list(self.rpc_presets.keys()),
             variable=self.rpc_preset_var,
             command=self._on_rpc_preset_changed,
-            **self.theme.get_button_style('secondary')
+            **self._styles['btn_secondary']
         )
         
-        self.rpc_entry = self.theme.create_styled_entry(
-            self.rpc_frame,
-            placeholder="https://your-endpoint.bsc.quicknode.pro/...",
-            width=400
-        )
-        self.rpc_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.rpc_frame, 'blockchain.rpc_url')
         
         self.test_connection_button = self.theme.create_styled_button(
             self.rpc_frame,
@@ -199,7 +362,7 @@ class SettingsTab(ctk.CTkFrame):
         )
         
         # Сетевые настройки
-        self.network_frame = self.theme.create_styled_frame(self.blockchain_frame, 'primary')
+        self.network_frame = ctk.CTkFrame(self.blockchain_frame, **self._styles['frame_primary'])
         
         self.network_label = self.theme.create_styled_label(
             self.network_frame,
@@ -213,11 +376,11 @@ class SettingsTab(ctk.CTkFrame):
             values=["BSC Mainnet", "BSC Testnet"],
             variable=self.network_var,
             command=self._on_network_changed,
-            **self.theme.get_button_style('secondary')
+            **self._styles['btn_secondary']
         )
         
         # Настройки запросов
-        self.requests_frame = self.theme.create_styled_frame(self.blockchain_frame, 'primary')
+        self.requests_frame = ctk.CTkFrame(self.blockchain_frame, **self._styles['frame_primary'])
         
         self.batch_size_label = self.theme.create_styled_label(
             self.requests_frame,
@@ -225,12 +388,7 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.batch_size_entry = self.theme.create_styled_entry(
-            self.requests_frame,
-            placeholder="100",
-            width=80
-        )
-        self.batch_size_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.requests_frame, 'blockchain.batch_size')
         
         self.timeout_label = self.theme.create_styled_label(
             self.requests_frame,
@@ -238,12 +396,7 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.timeout_entry = self.theme.create_styled_entry(
-            self.requests_frame,
-            placeholder="30",
-            width=80
-        )
-        self.timeout_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.requests_frame, 'blockchain.timeout')
         
         self.retries_label = self.theme.create_styled_label(
             self.requests_frame,
@@ -251,16 +404,11 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.retries_entry = self.theme.create_styled_entry(
-            self.requests_frame,
-            placeholder="3",
-            width=80
-        )
-        self.retries_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.requests_frame, 'blockchain.retries')
     
     def _create_analysis_settings(self) -> None:
         """Создание секции настроек анализа."""
-        self.analysis_frame = self.theme.create_styled_frame(self, 'card')
+        self.analysis_frame = ctk.CTkFrame(self, **self._styles['frame_card'])
         
         self.analysis_title = self.theme.create_styled_label(
             self.analysis_frame,
@@ -269,7 +417,7 @@ class SettingsTab(ctk.CTkFrame):
         )
         
         # Адреса контрактов
-        self.contracts_frame = self.theme.create_styled_frame(self.analysis_frame, 'primary')
+        self.contracts_frame = ctk.CTkFrame(self.analysis_frame, **self._styles['frame_primary'])
         
         self.plex_contract_label = self.theme.create_styled_label(
             self.contracts_frame,
@@ -277,12 +425,7 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.plex_contract_entry = self.theme.create_styled_entry(
-            self.contracts_frame,
-            placeholder="0x...",
-            width=350
-        )
-        self.plex_contract_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.contracts_frame, 'analysis.plex_contract')
         
         self.usdt_contract_label = self.theme.create_styled_label(
             self.contracts_frame,
@@ -290,15 +433,10 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.usdt_contract_entry = self.theme.create_styled_entry(
-            self.contracts_frame,
-            placeholder="0x...",
-            width=350
-        )
-        self.usdt_contract_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.contracts_frame, 'analysis.usdt_contract')
         
         # Параметры анализа
-        self.params_frame = self.theme.create_styled_frame(self.analysis_frame, 'primary')
+        self.params_frame = ctk.CTkFrame(self.analysis_frame, **self._styles['frame_primary'])
         
         self.min_volume_label = self.theme.create_styled_label(
             self.params_frame,
@@ -306,12 +444,7 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.min_volume_entry = self.theme.create_styled_entry(
-            self.params_frame,
-            placeholder="100",
-            width=100
-        )
-        self.min_volume_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.params_frame, 'analysis.min_volume')
         
         self.max_participants_label = self.theme.create_styled_label(
             self.params_frame,
@@ -319,15 +452,10 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.max_participants_entry = self.theme.create_styled_entry(
-            self.params_frame,
-            placeholder="1000",
-            width=100
-        )
-        self.max_participants_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.params_frame, 'analysis.max_participants')
         
         # Настройки кэширования
-        self.cache_frame = self.theme.create_styled_frame(self.analysis_frame, 'primary')
+        self.cache_frame = ctk.CTkFrame(self.analysis_frame, **self._styles['frame_primary'])
         
         self.cache_enabled_var = ctk.BooleanVar(value=True)
         self.cache_enabled_switch = ctk.CTkSwitch(
@@ -335,7 +463,7 @@ class SettingsTab(ctk.CTkFrame):
             text="Включить кэширование",
             variable=self.cache_enabled_var,
             command=self._on_setting_changed,
-            **self.theme.get_switch_style()
+            **self._styles['switch']
         )
         
         self.cache_ttl_label = self.theme.create_styled_label(
@@ -344,16 +472,11 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.cache_ttl_entry = self.theme.create_styled_entry(
-            self.cache_frame,
-            placeholder="60",
-            width=80
-        )
-        self.cache_ttl_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.cache_frame, 'analysis.cache_ttl')
     
     def _create_logging_settings(self) -> None:
         """Создание секции настроек логирования."""
-        self.logging_frame = self.theme.create_styled_frame(self, 'card')
+        self.logging_frame = ctk.CTkFrame(self, **self._styles['frame_card'])
         
         self.logging_title = self.theme.create_styled_label(
             self.logging_frame,
@@ -362,7 +485,7 @@ class SettingsTab(ctk.CTkFrame):
         )
         
         # Уровень логирования
-        self.log_level_frame = self.theme.create_styled_frame(self.logging_frame, 'primary')
+        self.log_level_frame = ctk.CTkFrame(self.logging_frame, **self._styles['frame_primary'])
         
         self.log_level_label = self.theme.create_styled_label(
             self.log_level_frame,
@@ -376,11 +499,11 @@ class SettingsTab(ctk.CTkFrame):
             values=["DEBUG", "INFO", "WARNING", "ERROR"],
             variable=self.log_level_var,
             command=self._on_log_level_changed,
-            **self.theme.get_button_style('secondary')
+            **self._styles['btn_secondary']
         )
         
         # Настройки файлов логов
-        self.log_file_frame = self.theme.create_styled_frame(self.logging_frame, 'primary')
+        self.log_file_frame = ctk.CTkFrame(self.logging_frame, **self._styles['frame_primary'])
         
         self.max_log_size_label = self.theme.create_styled_label(
             self.log_file_frame,
@@ -388,12 +511,7 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.max_log_size_entry = self.theme.create_styled_entry(
-            self.log_file_frame,
-            placeholder="100",
-            width=80
-        )
-        self.max_log_size_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.log_file_frame, 'logging.max_log_size')
         
         self.log_retention_label = self.theme.create_styled_label(
             self.log_file_frame,
@@ -401,12 +519,7 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.log_retention_entry = self.theme.create_styled_entry(
-            self.log_file_frame,
-            placeholder="30",
-            width=80
-        )
-        self.log_retention_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.log_file_frame, 'logging.log_retention')
         
         # Консольное логирование
         self.console_logging_var = ctk.BooleanVar(value=True)
@@ -415,12 +528,12 @@ class SettingsTab(ctk.CTkFrame):
             text="Логирование в консоль",
             variable=self.console_logging_var,
             command=self._on_setting_changed,
-            **self.theme.get_switch_style()
+            **self._styles['switch']
         )
     
     def _create_backup_settings(self) -> None:
         """Создание секции настроек резервного копирования."""
-        self.backup_frame = self.theme.create_styled_frame(self, 'card')
+        self.backup_frame = ctk.CTkFrame(self, **self._styles['frame_card'])
         
         self.backup_title = self.theme.create_styled_label(
             self.backup_frame,
@@ -429,7 +542,7 @@ class SettingsTab(ctk.CTkFrame):
         )
         
         # Автоматическое резервное копирование
-        self.auto_backup_frame = self.theme.create_styled_frame(self.backup_frame, 'primary')
+        self.auto_backup_frame = ctk.CTkFrame(self.backup_frame, **self._styles['frame_primary'])
         
         self.auto_backup_var = ctk.BooleanVar(value=True)
         self.auto_backup_switch = ctk.CTkSwitch(
@@ -437,7 +550,7 @@ class SettingsTab(ctk.CTkFrame):
             text="Автоматическое резервное копирование",
             variable=self.auto_backup_var,
             command=self._on_setting_changed,
-            **self.theme.get_switch_style()
+            **self._styles['switch']
         )
         
         self.backup_interval_label = self.theme.create_styled_label(
@@ -446,15 +559,10 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.backup_interval_entry = self.theme.create_styled_entry(
-            self.auto_backup_frame,
-            placeholder="24",
-            width=80
-        )
-        self.backup_interval_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.auto_backup_frame, 'backup.backup_interval')
         
         # Путь для бэкапов
-        self.backup_path_frame = self.theme.create_styled_frame(self.backup_frame, 'primary')
+        self.backup_path_frame = ctk.CTkFrame(self.backup_frame, **self._styles['frame_primary'])
         
         self.backup_path_label = self.theme.create_styled_label(
             self.backup_path_frame,
@@ -462,12 +570,7 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.backup_path_entry = self.theme.create_styled_entry(
-            self.backup_path_frame,
-            placeholder="./backups",
-            width=300
-        )
-        self.backup_path_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.backup_path_frame, 'backup.backup_path')
         
         self.browse_backup_button = self.theme.create_styled_button(
             self.backup_path_frame,
@@ -484,16 +587,11 @@ class SettingsTab(ctk.CTkFrame):
             'primary'
         )
         
-        self.backup_retention_entry = self.theme.create_styled_entry(
-            self.backup_path_frame,
-            placeholder="7",
-            width=80
-        )
-        self.backup_retention_entry.bind('<KeyRelease>', self._on_setting_changed)
+        self._create_entry(self.backup_path_frame, 'backup.backup_retention')
     
     def _create_interface_settings(self) -> None:
         """Создание секции настроек интерфейса."""
-        self.interface_frame = self.theme.create_styled_frame(self, 'card')
+        self.interface_frame = ctk.CTkFrame(self, **self._styles['frame_card'])
         
         self.interface_title = self.theme.create_styled_label(
             self.interface_frame,
@@ -502,7 +600,7 @@ class SettingsTab(ctk.CTkFrame):
         )
         
         # Тема интерфейса
-        self.theme_frame = self.theme.create_styled_frame(self.interface_frame, 'primary')
+        self.theme_frame = ctk.CTkFrame(self.interface_frame, **self._styles['frame_primary'])
         
         self.ui_theme_label = self.theme.create_styled_label(
             self.theme_frame,
@@ -516,7 +614,7 @@ class SettingsTab(ctk.CTkFrame):
             values=["Темная", "Светлая", "Системная"],
             variable=self.ui_theme_var,
             command=self._on_theme_changed,
-            **self.theme.get_button_style('secondary')
+            **self._styles['btn_secondary']
         )
         
         # Языковые настройки
@@ -532,11 +630,11 @@ class SettingsTab(ctk.CTkFrame):
             values=["Русский", "English"],
             variable=self.language_var,
             command=self._on_language_changed,
-            **self.theme.get_button_style('secondary')
+            **self._styles['btn_secondary']
         )
         
         # Настройки уведомлений
-        self.notifications_frame = self.theme.create_styled_frame(self.interface_frame, 'primary')
+        self.notifications_frame = ctk.CTkFrame(self.interface_frame, **self._styles['frame_primary'])
         
         self.notifications_var = ctk.BooleanVar(value=True)
         self.notifications_switch = ctk.CTkSwitch(
@@ -544,7 +642,7 @@ class SettingsTab(ctk.CTkFrame):
             text="Показывать уведомления",
             variable=self.notifications_var,
             command=self._on_setting_changed,
-            **self.theme.get_switch_style()
+            **self._styles['switch']
         )
         
         self.sound_notifications_var = ctk.BooleanVar(value=False)
@@ -553,7 +651,7 @@ class SettingsTab(ctk.CTkFrame):
             text="Звуковые уведомления",
             variable=self.sound_notifications_var,
             command=self._on_setting_changed,
-            **self.theme.get_switch_style()
+            **self._styles['switch']
         )
         
         # Автосохранение
@@ -563,7 +661,7 @@ class SettingsTab(ctk.CTkFrame):
             text="Автосохранение настроек",
             variable=self.autosave_var,
             command=self._on_setting_changed,
-            **self.theme.get_switch_style()
+            **self._styles['switch']
         )
     
     def _setup_layout(self) -> None:
@@ -574,21 +672,14 @@ class SettingsTab(ctk.CTkFrame):
         # Создание прокручиваемой области для всех настроек
         self.scrollable_frame = ctk.CTkScrollableFrame(
             self,
-            **self.theme.get_frame_style('primary')
+            **self._styles['frame_primary']
         )
         self.scrollable_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
-        # Размещение секций настроек
-        self._setup_blockchain_layout()
-        self._setup_analysis_layout()
-        self._setup_logging_layout()
-        self._setup_backup_layout()
-        self._setup_interface_layout()
-        
         # Кнопки управления (не в прокручиваемой области)
         self.control_frame.pack(fill='x', padx=20, pady=(10, 20))
           # Строка кнопок
-        buttons_frame = self.theme.create_styled_frame(self.control_frame, 'primary')
+        buttons_frame = ctk.CTkFrame(self.control_frame, **self._styles['frame_primary'])
         buttons_frame.pack(fill='x', pady=10)
         
         self.save_button.pack(side='left', padx=(10, 10))
@@ -601,201 +692,166 @@ class SettingsTab(ctk.CTkFrame):
         self.status_frame.pack(fill='x', pady=(5, 10))
         self.changes_label.pack()
     
+    def _ensure_sections_built(self) -> None:
+        """Создание и размещение секций настроек при первом обращении."""
+        if self._sections_built:
+            return
+        self._sections_built = True
+        
+        self._create_blockchain_settings()
+        self._create_analysis_settings()
+        self._create_logging_settings()
+        self._create_backup_settings()
+        self._create_interface_settings()
+        
+        self._setup_blockchain_layout()
+        self._setup_analysis_layout()
+        self._setup_logging_layout()
+        self._setup_backup_layout()
+        self._setup_interface_layout()
+        
+        self._apply_settings_to_widgets()
+    
     def _setup_blockchain_layout(self) -> None:
         """Настройка макета секции блокчейна."""
-        self.blockchain_frame.pack(fill='x', pady=(0, 10))
+        self.blockchain_frame.pack(fill='x', pady=(0, 10), before=self.control_frame)
         
         self.blockchain_title.pack(pady=(15, 10))
-          # RPC URL
+        
+        # RPC URL
         self.rpc_frame.pack(fill='x', padx=15, pady=5)
+        self.rpc_frame.columnconfigure(1, weight=1)
         
         # Предустановленные RPC
-        self.preset_rpc_frame.pack(fill='x', pady=(0, 5))
+        self.preset_rpc_frame.grid(row=0, column=0, columnspan=3, sticky='w', pady=(0, 5))
         self.preset_rpc_label.pack(side='left', anchor='w')
         self.rpc_preset_menu.pack(side='left', padx=(10, 0))
         
         # RPC URL поле ввода
-        rpc_row = self.theme.create_styled_frame(self.rpc_frame, 'primary')
-        rpc_row.pack(fill='x', pady=5)
-        
-        self.rpc_label.pack(side='left', anchor='w')
-        self.test_connection_button.pack(side='right', padx=(5, 0))
-        self.rpc_entry.pack(side='right', padx=(10, 5))
+        self.rpc_label.grid(row=1, column=0, sticky='w', pady=5)
+        self._entries['blockchain.rpc_url'].grid(row=1, column=1, sticky='ew', padx=(10, 5), pady=5)
+        self.test_connection_button.grid(row=1, column=2, padx=(5, 0), pady=5)
         
         # Сеть
         self.network_frame.pack(fill='x', padx=15, pady=5)
         
-        network_row = self.theme.create_styled_frame(self.network_frame, 'primary')
-        network_row.pack(fill='x', pady=5)
-        
-        self.network_label.pack(side='left')
-        self.network_menu.pack(side='left', padx=(10, 0))
+        self.network_label.grid(row=0, column=0, sticky='w', pady=5)
+        self.network_menu.grid(row=0, column=1, padx=(10, 0), pady=5)
         
         # Параметры запросов
         self.requests_frame.pack(fill='x', padx=15, pady=(5, 15))
         
-        requests_row = self.theme.create_styled_frame(self.requests_frame, 'primary')
-        requests_row.pack(fill='x', pady=5)
-        
-        self.batch_size_label.pack(side='left')
-        self.batch_size_entry.pack(side='left', padx=(10, 20))
+        self.batch_size_label.grid(row=0, column=0, sticky='w', pady=5)
+        self._entries['blockchain.batch_size'].grid(row=0, column=1, padx=(10, 20), pady=5)
         
-        self.timeout_label.pack(side='left')
-        self.timeout_entry.pack(side='left', padx=(10, 20))
+        self.timeout_label.grid(row=0, column=2, pady=5)
+        self._entries['blockchain.timeout'].grid(row=0, column=3, padx=(10, 20), pady=5)
         
-        self.retries_label.pack(side='left')
-        self.retries_entry.pack(side='left', padx=(10, 0))
+        self.retries_label.grid(row=0, column=4, pady=5)
+        self._entries['blockchain.retries'].grid(row=0, column=5, padx=(10, 0), pady=5)
     
     def _setup_analysis_layout(self) -> None:
         """Настройка макета секции анализа."""
-        self.analysis_frame.pack(fill='x', pady=(0, 10))
+        self.analysis_frame.pack(fill='x', pady=(0, 10), before=self.control_frame)
         
         self.analysis_title.pack(pady=(15, 10))
         
         # Контракты
         self.contracts_frame.pack(fill='x', padx=15, pady=5)
+        self.contracts_frame.columnconfigure(0, weight=1)
         
-        plex_row = self.theme.create_styled_frame(self.contracts_frame, 'primary')
-        plex_row.pack(fill='x', pady=2)
-        
-        self.plex_contract_label.pack(side='left', anchor='w')
-        self.plex_contract_entry.pack(side='right', padx=(10, 0))
+        self.plex_contract_label.grid(row=0, column=0, sticky='w', pady=2)
+        self._entries['analysis.plex_contract'].grid(row=0, column=1, sticky='e', padx=(10, 0), pady=2)
         
-        usdt_row = self.theme.create_styled_frame(self.contracts_frame, 'primary')
-        usdt_row.pack(fill='x', pady=2)
-        
-        self.usdt_contract_label.pack(side='left', anchor='w')
-        self.usdt_contract_entry.pack(side='right', padx=(10, 0))
+        self.usdt_contract_label.grid(row=1, column=0, sticky='w', pady=2)
+        self._entries['analysis.usdt_contract'].grid(row=1, column=1, sticky='e', padx=(10, 0), pady=2)
         
         # Параметры анализа
         self.params_frame.pack(fill='x', padx=15, pady=5)
         
-        params_row = self.theme.create_styled_frame(self.params_frame, 'primary')
-        params_row.pack(fill='x', pady=5)
-        
-        self.min_volume_label.pack(side='left')
-        self.min_volume_entry.pack(side='left', padx=(10, 20))
+        self.min_volume_label.grid(row=0, column=0, sticky='w', pady=5)
+        self._entries['analysis.min_volume'].grid(row=0, column=1, padx=(10, 20), pady=5)
         
-        self.max_participants_label.pack(side='left')
-        self.max_participants_entry.pack(side='left', padx=(10, 0))
+        self.max_participants_label.grid(row=0, column=2, pady=5)
+        self._entries['analysis.max_participants'].grid(row=0, column=3, padx=(10, 0), pady=5)
         
         # Кэширование
         self.cache_frame.pack(fill='x', padx=15, pady=(5, 15))
         
-        cache_row1 = self.theme.create_styled_frame(self.cache_frame, 'primary')
-        cache_row1.pack(fill='x', pady=2)
+        self.cache_enabled_switch.grid(row=0, column=0, columnspan=2, sticky='w', pady=2)
         
-        self.cache_enabled_switch.pack(side='left')
-        
-        cache_row2 = self.theme.create_styled_frame(self.cache_frame, 'primary')
-        cache_row2.pack(fill='x', pady=2)
-        
-        self.cache_ttl_label.pack(side='left')
-        self.cache_ttl_entry.pack(side='left', padx=(10, 0))
+        self.cache_ttl_label.grid(row=1, column=0, sticky='w', pady=2)
+        self._entries['analysis.cache_ttl'].grid(row=1, column=1, padx=(10, 0), pady=2)
     
     def _setup_logging_layout(self) -> None:
         """Настройка макета секции логирования."""
-        self.logging_frame.pack(fill='x', pady=(0, 10))
+        self.logging_frame.pack(fill='x', pady=(0, 10), before=self.control_frame)
         
         self.logging_title.pack(pady=(15, 10))
         
         # Уровень логирования
         self.log_level_frame.pack(fill='x', padx=15, pady=5)
         
-        log_level_row = self.theme.create_styled_frame(self.log_level_frame, 'primary')
-        log_level_row.pack(fill='x', pady=5)
-        
-        self.log_level_label.pack(side='left')
-        self.log_level_menu.pack(side='left', padx=(10, 0))
+        self.log_level_label.grid(row=0, column=0, sticky='w', pady=5)
+        self.log_level_menu.grid(row=0, column=1, padx=(10, 0), pady=5)
         
         # Файлы логов
         self.log_file_frame.pack(fill='x', padx=15, pady=(5, 15))
         
-        log_file_row1 = self.theme.create_styled_frame(self.log_file_frame, 'primary')
-        log_file_row1.pack(fill='x', pady=2)
-        
-        self.max_log_size_label.pack(side='left')
-        self.max_log_size_entry.pack(side='left', padx=(10, 20))
+        self.max_log_size_label.grid(row=0, column=0, sticky='w', pady=2)
+        self._entries['logging.max_log_size'].grid(row=0, column=1, padx=(10, 20), pady=2)
         
-        self.log_retention_label.pack(side='left')
-        self.log_retention_entry.pack(side='left', padx=(10, 0))
+        self.log_retention_label.grid(row=0, column=2, pady=2)
+        self._entries['logging.log_retention'].grid(row=0, column=3, padx=(10, 0), pady=2)
         
-        log_file_row2 = self.theme.create_styled_frame(self.log_file_frame, 'primary')
-        log_file_row2.pack(fill='x', pady=2)
-        
-        self.console_logging_switch.pack(side='left')
+        self.console_logging_switch.grid(row=1, column=0, columnspan=4, sticky='w', pady=2)
     
     def _setup_backup_layout(self) -> None:
         """Настройка макета секции резервного копирования."""
-        self.backup_frame.pack(fill='x', pady=(0, 10))
+        self.backup_frame.pack(fill='x', pady=(0, 10), before=self.control_frame)
         
         self.backup_title.pack(pady=(15, 10))
         
         # Автоматическое резервное копирование
         self.auto_backup_frame.pack(fill='x', padx=15, pady=5)
         
-        auto_backup_row1 = self.theme.create_styled_frame(self.auto_backup_frame, 'primary')
-        auto_backup_row1.pack(fill='x', pady=2)
-        
-        self.auto_backup_switch.pack(side='left')
-        
-        auto_backup_row2 = self.theme.create_styled_frame(self.auto_backup_frame, 'primary')
-        auto_backup_row2.pack(fill='x', pady=2)
+        self.auto_backup_switch.grid(row=0, column=0, columnspan=2, sticky='w', pady=2)
         
-        self.backup_interval_label.pack(side='left')
-        self.backup_interval_entry.pack(side='left', padx=(10, 0))
+        self.backup_interval_label.grid(row=1, column=0, sticky='w', pady=2)
+        self._entries['backup.backup_interval'].grid(row=1, column=1, padx=(10, 0), pady=2)
         
         # Путь для бэкапов
         self.backup_path_frame.pack(fill='x', padx=15, pady=(5, 15))
+        self.backup_path_frame.columnconfigure(1, weight=1)
         
-        backup_path_row1 = self.theme.create_styled_frame(self.backup_path_frame, 'primary')
-        backup_path_row1.pack(fill='x', pady=2)
-        
-        self.backup_path_label.pack(side='left', anchor='w')
-        self.browse_backup_button.pack(side='right', padx=(5, 0))
-        self.backup_path_entry.pack(side='right', padx=(10, 5))
-        
-        backup_path_row2 = self.theme.create_styled_frame(self.backup_path_frame, 'primary')
-        backup_path_row2.pack(fill='x', pady=2)
+        self.backup_path_label.grid(row=0, column=0, sticky='w', pady=2)
+        self._entries['backup.backup_path'].grid(row=0, column=1, sticky='ew', padx=(10, 5), pady=2)
+        self.browse_backup_button.grid(row=0, column=2, padx=(5, 0), pady=2)
         
-        self.backup_retention_label.pack(side='left')
-        self.backup_retention_entry.pack(side='left', padx=(10, 0))
+        self.backup_retention_label.grid(row=1, column=0, sticky='w', pady=2)
+        self._entries['backup.backup_retention'].grid(row=1, column=1, sticky='w', padx=(10, 0), pady=2)
     
     def _setup_interface_layout(self) -> None:
         """Настройка макета секции интерфейса."""
-        self.interface_frame.pack(fill='x', pady=(0, 10))
+        self.interface_frame.pack(fill='x', pady=(0, 10), before=self.control_frame)
         
         self.interface_title.pack(pady=(15, 10))
         
         # Тема
         self.theme_frame.pack(fill='x', padx=15, pady=5)
         
-        theme_row = self.theme.create_styled_frame(self.theme_frame, 'primary')
-        theme_row.pack(fill='x', pady=2)
+        self.ui_theme_label.grid(row=0, column=0, sticky='w', pady=2)
+        self.ui_theme_menu.grid(row=0, column=1, padx=(10, 20), pady=2)
         
-        self.ui_theme_label.pack(side='left')
-        self.ui_theme_menu.pack(side='left', padx=(10, 20))
-        
-        self.language_label.pack(side='left')
-        self.language_menu.pack(side='left', padx=(10, 0))
+        self.language_label.grid(row=0, column=2, pady=2)
+        self.language_menu.grid(row=0, column=3, padx=(10, 0), pady=2)
         
         # Уведомления
         self.notifications_frame.pack(fill='x', padx=15, pady=(5, 15))
         
-        notif_row1 = self.theme.create_styled_frame(self.notifications_frame, 'primary')
-        notif_row1.pack(fill='x', pady=2)
-        
-        self.notifications_switch.pack(side='left')
-        
-        notif_row2 = self.theme.create_styled_frame(self.notifications_frame, 'primary')
-        notif_row2.pack(fill='x', pady=2)
-        
-        self.sound_notifications_switch.pack(side='left')
-        
-        notif_row3 = self.theme.create_styled_frame(self.notifications_frame, 'primary')
-        notif_row3.pack(fill='x', pady=2)
-        
-        self.autosave_switch.pack(side='left')
+        self.notifications_switch.grid(row=0, column=0, sticky='w', pady=2)
+        self.sound_notifications_switch.grid(row=1, column=0, sticky='w', pady=2)
+        self.autosave_switch.grid(row=2, column=0, sticky='w', pady=2)
     
     def _load_current_settings(self) -> None:
         """Загрузка текущих настроек."""
@@ -804,8 +860,10 @@ class SettingsTab(ctk.CTkFrame):
             settings_file = os.path.join(os.path.dirname(__file__), '..', '..', 'config', 'app_settings.json')
             
             if os.path.exists(settings_file):
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    self.current_settings = json.load(f)
+                with open(settings_file, 'rb') as f:
+                    data = f.read()
+                self.current_settings = _loads_settings(data)
+                self._last_saved_hash = _settings_hash(data)
             else:
                 self.current_settings = self._get_default_settings()
               # Применение настроек к виджетам
@@ -818,134 +876,43 @@ class SettingsTab(ctk.CTkFrame):
     
     def _get_default_settings(self) -> Dict[str, Any]:
         """Получение настроек по умолчанию из .env файла."""
-        # Загрузка переменных из .env файла
-        env_vars = self._load_env_variables()
-        
-        return {
-            'blockchain': {
-                'rpc_url': env_vars.get('QUICKNODE_HTTP', ''),
-                'wss_url': env_vars.get('QUICKNODE_WSS', ''),
-                'api_key': env_vars.get('QUICKNODE_API_KEY', ''),
-                'network': 'BSC_MAINNET',
-                'batch_size': int(env_vars.get('MAX_BLOCKS_PER_CHUNK', 100)),
-                'timeout': 30,
-                'retries': 3
-            },
-            'analysis': {
-                'plex_contract': env_vars.get('TOKEN_ADDRESS', '0xdf179b6cAdBC61FFD86A3D2e55f6d6e083ade6c1'),
-                'usdt_contract': env_vars.get('USDT_BSC', '0x55d398326f99059fF775485246999027B3197955'),
-                'min_volume': float(env_vars.get('MIN_BALANCE', 100)),
-                'max_participants': 1000,
-                'cache_enabled': True,
-                'cache_ttl': 60,
-                'daily_purchase_min': float(env_vars.get('DAILY_PURCHASE_MIN', 2.8)),
-                'daily_purchase_max': float(env_vars.get('DAILY_PURCHASE_MAX', 3.2))
-            },
-            'logging': {
-                'level': env_vars.get('LOG_LEVEL', 'INFO'),
-                'max_log_size': 100,
-                'log_retention': 30,
-                'console_logging': True,
-                'log_file': env_vars.get('LOG_FILE', 'logs/plex_staking.log')
-            },
-            'backup': {
-                'auto_backup': True,
-                'backup_interval': 24,
-                'backup_path': './backups',
-                'backup_retention': 7
-            },
-            'interface': {
-                'theme': env_vars.get('THEME', 'dark'),
-                'language': 'ru',
-                'notifications': True,
-                'sound_notifications': False,
-                'autosave': True
-            }
-        }
+        # Копия: кэшированный шаблон не должен меняться через current_settings
+        return copy.deepcopy(_build_default_settings(_env_file_mtime()))
     
-    def _load_env_variables(self) -> Dict[str, str]:
-        """Загрузка переменных окружения из .env файла."""
-        env_vars = {}
-        env_file_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
-        
-        try:
-            if os.path.exists(env_file_path):
-                with open(env_file_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            env_vars[key.strip()] = value.strip()
-            else:
-                logger.warning(f"⚠️ Файл .env не найден: {env_file_path}")
-        except Exception as e:
-            logger.error(f"❌ Ошибка загрузки .env файла: {e}")
-        
-        return env_vars
+    def reload_env(self) -> None:
+        """Сброс кэшей .env и настроек по умолчанию для повторного чтения файла."""
+        _parse_env_file.cache_clear()
+        _build_default_settings.cache_clear()
 
     def _apply_settings_to_widgets(self) -> None:
         """Применение настроек к виджетам."""
+        if not self._sections_built:
+            # Настройки применятся после создания секций
+            return
+        
+        self._applying = True
         try:
-            # Блокчейн настройки
+            # Поля ввода по схеме _ENTRY_SCHEMA
+            for key, entry in self._entries.items():
+                section, name = key.split('.', 1)
+                default = _ENTRY_SCHEMA[key][1]
+                entry.delete(0, 'end')
+                entry.insert(0, str(self.current_settings.get(section, {}).get(name, default)))
+            
+            # Переключатели и списки
             blockchain = self.current_settings.get('blockchain', {})
-            self.rpc_entry.delete(0, 'end')
-            self.rpc_entry.insert(0, blockchain.get('rpc_url', ''))
             self.network_var.set(blockchain.get('network', 'BSC_MAINNET'))
             
-            self.batch_size_entry.delete(0, 'end')
-            self.batch_size_entry.insert(0, str(blockchain.get('batch_size', 100)))
-            
-            self.timeout_entry.delete(0, 'end')
-            self.timeout_entry.insert(0, str(blockchain.get('timeout', 30)))
-            
-            self.retries_entry.delete(0, 'end')
-            self.retries_entry.insert(0, str(blockchain.get('retries', 3)))
-            
-            # Настройки анализа
             analysis = self.current_settings.get('analysis', {})
-            self.plex_contract_entry.delete(0, 'end')
-            self.plex_contract_entry.insert(0, analysis.get('plex_contract', ''))
-            
-            self.usdt_contract_entry.delete(0, 'end')
-            self.usdt_contract_entry.insert(0, analysis.get('usdt_contract', ''))
-            
-            self.min_volume_entry.delete(0, 'end')
-            self.min_volume_entry.insert(0, str(analysis.get('min_volume', 100)))
-            
-            self.max_participants_entry.delete(0, 'end')
-            self.max_participants_entry.insert(0, str(analysis.get('max_participants', 1000)))
-            
             self.cache_enabled_var.set(analysis.get('cache_enabled', True))
             
-            self.cache_ttl_entry.delete(0, 'end')
-            self.cache_ttl_entry.insert(0, str(analysis.get('cache_ttl', 60)))
-            
-            # Настройки логирования
             logging_settings = self.current_settings.get('logging', {})
             self.log_level_var.set(logging_settings.get('level', 'INFO'))
-            
-            self.max_log_size_entry.delete(0, 'end')
-            self.max_log_size_entry.insert(0, str(logging_settings.get('max_log_size', 100)))
-            
-            self.log_retention_entry.delete(0, 'end')
-            self.log_retention_entry.insert(0, str(logging_settings.get('log_retention', 30)))
-            
             self.console_logging_var.set(logging_settings.get('console_logging', True))
             
-            # Настройки резервного копирования
             backup = self.current_settings.get('backup', {})
             self.auto_backup_var.set(backup.get('auto_backup', True))
             
-            self.backup_interval_entry.delete(0, 'end')
-            self.backup_interval_entry.insert(0, str(backup.get('backup_interval', 24)))
-            
-            self.backup_path_entry.delete(0, 'end')
-            self.backup_path_entry.insert(0, backup.get('backup_path', './backups'))
-            
-            self.backup_retention_entry.delete(0, 'end')
-            self.backup_retention_entry.insert(0, str(backup.get('backup_retention', 7)))
-            
-            # Настройки интерфейса
             interface = self.current_settings.get('interface', {})
             self.ui_theme_var.set(interface.get('theme', 'dark'))
             self.language_var.set(interface.get('language', 'ru'))
@@ -954,28 +921,58 @@ class SettingsTab(ctk.CTkFrame):
             self.autosave_var.set(interface.get('autosave', True))
             
             # Сброс флага изменений
+            self._cancel_dirty_mark()
             self.unsaved_changes = False
             self._update_changes_status()
             
         except Exception as e:
             logger.error(f"❌ Ошибка применения настроек: {e}")
+        finally:
+            self._applying = False
     
     def _on_setting_changed(self, event=None) -> None:
-        """Обработка изменения настройки."""
-        self.unsaved_changes = True
-        self._update_changes_status()
+        """
+        Обработка изменения настройки.
         
-        # Автосохранение если включено
+        Отметка изменений откладывается до паузы в наборе: серия нажатий
+        клавиш дает один вызов _mark_dirty вместо вызова на символ.
+        """
+        if self._applying:
+            return
+        self._cancel_dirty_mark()
+        self._dirty_after_id = self.after(_DIRTY_DEBOUNCE_MS, self._mark_dirty)
+        
+        # Автосохранение если включено: одна запись файла на серию правок
         if self.autosave_var.get():
-            self.after_idle(self._save_settings)
+            self._cancel_autosave()
+            self._save_after_id = self.after(_AUTOSAVE_DEBOUNCE_MS, self._save_settings)
+    
+    def _cancel_dirty_mark(self) -> None:
+        """Отмена отложенной отметки изменений."""
+        if self._dirty_after_id:
+            self.after_cancel(self._dirty_after_id)
+            self._dirty_after_id = None
+    
+    def _cancel_autosave(self) -> None:
+        """Отмена отложенного автосохранения."""
+        if self._save_after_id:
+            self.after_cancel(self._save_after_id)
+            self._save_after_id = None
+    
+    def _mark_dirty(self) -> None:
+        """Отметка несохраненных изменений."""
+        self._dirty_after_id = None
+        if not self.unsaved_changes:
+            self.unsaved_changes = True
+            self._update_changes_status()
     
     def _on_rpc_preset_changed(self, value: str) -> None:
         """Обработка изменения предустановленного RPC."""
         if value in self.rpc_presets:
             preset_url = self.rpc_presets[value]
             if preset_url:
-                self.rpc_entry.delete(0, 'end')
-                self.rpc_entry.insert(0, preset_url)
+                self._entries['blockchain.rpc_url'].delete(0, 'end')
+                self._entries['blockchain.rpc_url'].insert(0, preset_url)
                 self._on_setting_changed()
     
     def _on_network_changed(self, value: str) -> None:
@@ -998,6 +995,11 @@ class SettingsTab(ctk.CTkFrame):
     
     def _update_changes_status(self) -> None:
         """Обновление статуса изменений."""
+        # configure у CTk-виджета перерисовывает его, пропускаем повторы
+        if self.unsaved_changes == self._shown_unsaved:
+            return
+        self._shown_unsaved = self.unsaved_changes
+        
         if self.unsaved_changes:
             self.changes_label.configure(
                 text="⚠️ Есть несохраненные изменения",
@@ -1011,35 +1013,24 @@ class SettingsTab(ctk.CTkFrame):
     
     def _save_settings(self) -> None:
         """Сохранение настроек."""
+        self._cancel_autosave()
+        self._ensure_sections_built()
+        
         try:
             # Сбор настроек из виджетов
             new_settings = {
                 'blockchain': {
-                    'rpc_url': self.rpc_entry.get(),
-                    'network': self.network_var.get(),
-                    'batch_size': int(self.batch_size_entry.get() or 100),
-                    'timeout': int(self.timeout_entry.get() or 30),
-                    'retries': int(self.retries_entry.get() or 3)
+                    'network': self.network_var.get()
                 },
                 'analysis': {
-                    'plex_contract': self.plex_contract_entry.get(),
-                    'usdt_contract': self.usdt_contract_entry.get(),
-                    'min_volume': float(self.min_volume_entry.get() or 100),
-                    'max_participants': int(self.max_participants_entry.get() or 1000),
-                    'cache_enabled': self.cache_enabled_var.get(),
-                    'cache_ttl': int(self.cache_ttl_entry.get() or 60)
+                    'cache_enabled': self.cache_enabled_var.get()
                 },
                 'logging': {
                     'level': self.log_level_var.get(),
-                    'max_log_size': int(self.max_log_size_entry.get() or 100),
-                    'log_retention': int(self.log_retention_entry.get() or 30),
                     'console_logging': self.console_logging_var.get()
                 },
                 'backup': {
-                    'auto_backup': self.auto_backup_var.get(),
-                    'backup_interval': int(self.backup_interval_entry.get() or 24),
-                    'backup_path': self.backup_path_entry.get() or './backups',
-                    'backup_retention': int(self.backup_retention_entry.get() or 7)
+                    'auto_backup': self.auto_backup_var.get()
                 },
                 'interface': {
                     'theme': self.ui_theme_var.get(),
@@ -1049,16 +1040,38 @@ class SettingsTab(ctk.CTkFrame):
                     'autosave': self.autosave_var.get()
                 }
             }
+            for key, entry in self._entries.items():
+                section, name = key.split('.', 1)
+                value_type, default = _ENTRY_SCHEMA[key][:2]
+                new_settings[section][name] = value_type(entry.get() or default)
             
             # Сохранение в файл
             settings_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'config')
             os.makedirs(settings_dir, exist_ok=True)
             
             settings_file = os.path.join(settings_dir, 'app_settings.json')
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(new_settings, f, indent=2, ensure_ascii=False)
+            blob = _dumps_settings(new_settings)
+            blob_hash = _settings_hash(blob)
+            
+            # Запись только при изменении содержимого; через временный файл,
+            # чтобы сбой во время записи не оставил поврежденный JSON
+            if blob_hash != self._last_saved_hash or not os.path.exists(settings_file):
+                tmp_file = settings_file + '.tmp'
+                try:
+                    with open(tmp_file, 'wb') as f:
+                        f.write(blob)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_file, settings_file)
+                except Exception:
+                    # Не оставляем недописанный .tmp рядом с настройками
+                    if os.path.exists(tmp_file):
+                        os.unlink(tmp_file)
+                    raise
+                self._last_saved_hash = blob_hash
             
             self.current_settings = new_settings
+            self._cancel_dirty_mark()
             self.unsaved_changes = False
             self._update_changes_status()
             
@@ -1109,7 +1122,8 @@ class SettingsTab(ctk.CTkFrame):
                 if os.path.exists(settings_file):
                     os.remove(settings_file)
                 
-                # Загрузить заводские настройки
+                # Загрузить заводские настройки (с перечитыванием .env)
+                self.reload_env()
                 self.current_settings = self._get_default_settings()
                 self._apply_settings_to_widgets()
                 self._save_settings()
@@ -1150,8 +1164,8 @@ class SettingsTab(ctk.CTkFrame):
                 'version': '1.0.0'
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(_dumps_settings(export_data))
             
             messagebox.showinfo("Успех", f"Настройки экспортированы в:\\n{file_path}")
             
@@ -1174,8 +1188,8 @@ class SettingsTab(ctk.CTkFrame):
                 return
             
             # Загрузка настроек из файла
-            with open(file_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                import_data = _loads_settings(f.read())
             
             # Проверка формата
             if 'settings' not in import_data:
@@ -1203,7 +1217,7 @@ class SettingsTab(ctk.CTkFrame):
     def _test_blockchain_connection(self) -> None:
         """Тестирование подключения к блокчейну."""
         try:
-            rpc_url = self.rpc_entry.get()
+            rpc_url = self._entries['blockchain.rpc_url'].get()
             if not rpc_url:
                 messagebox.showwarning("Предупреждение", "Введите RPC URL для тестирования")
                 return
@@ -1241,12 +1255,12 @@ class SettingsTab(ctk.CTkFrame):
         try:
             directory = filedialog.askdirectory(
                 title="Выберите папку для резервных копий",
-                initialdir=self.backup_path_entry.get() or "."
+                initialdir=self._entries['backup.backup_path'].get() or "."
             )
             
             if directory:
-                self.backup_path_entry.delete(0, 'end')
-                self.backup_path_entry.insert(0, directory)
+                self._entries['backup.backup_path'].delete(0, 'end')
+                self._entries['backup.backup_path'].insert(0, directory)
                 self._on_setting_changed()
                 
         except Exception as e: